@@ -1,14 +1,12 @@
+# Heavy modules are imported where they are first needed, not here, so the
+# first render doesn't wait on them: pandas for the skill chart, the analysis
+# stack (numpy/scipy NLP indexes) on Analyze, pdfplumber on upload (inside
+# utils.pdf_reader). Scoring uses the compact model, so sklearn and joblib
+# are never loaded while models/placement_model.npz is current.
+# benchmarks/bench_startup.py keeps this honest.
 import streamlit as st
-import numpy as np
-import joblib
-import pandas as pd
-import time
-from nlp.resume_quality import calculate_resume_quality
-from nlp.skill_extractor import extract_skills
-from utils.validation import validate_resume_text
-from utils.pdf_reader import extract_text_from_pdf
-from models.predictor import predict_placement
-from config.roles import role_difficulty, role_descriptions
+from utils.ingest import get_ingest_queue
+from config.roles import role_descriptions
 from data.demo_profiles import (
     STRONG_RESUME,
     AVERAGE_RESUME,
@@ -17,10 +15,14 @@ from data.demo_profiles import (
     AVERAGE_JD,
     WEAK_JD,
 )
-from nlp.skill_extractor import extract_keywords
+from utils.resource_cache import (
+    load_model, load_compact_model, read_text, read_bytes, cache_info, file_version, file_digest
+)
+
+MODEL_PATH = "models/placement_model.pkl"
+COMPACT_MODEL_PATH = "models/placement_model.npz"
 
-with open("assets/style.css", encoding="utf-8") as f:
-    st.markdown(f"<style>{f.read()}</style>", unsafe_allow_html=True)
+st.markdown(f"<style>{read_text('assets/style.css')}</style>", unsafe_allow_html=True)
 
 # ---------------- CONFIG ----------------
 st.set_page_config(
@@ -29,8 +31,20 @@ st.set_page_config(
 )
 
 # ---------------- LOAD MODEL SAFELY ----------------
+# The compact export scores without sklearn; it is only trusted while it
+# was exported from the current pickle.
+def load_scoring_model():
+    try:
+        compact = load_compact_model(COMPACT_MODEL_PATH)
+        if compact.source == file_digest(MODEL_PATH):
+            return compact, COMPACT_MODEL_PATH, "compact"
+    except (OSError, ValueError, KeyError):
+        pass
+
+    return load_model(MODEL_PATH), MODEL_PATH, "model"
+
 try:
-    model = joblib.load("models/placement_model.pkl")
+    model, model_path, model_kind = load_scoring_model()
 except:
     st.error("Model file not found. Please run train_model.py first.")
     st.stop()
@@ -43,7 +57,7 @@ logo_path = Path(__file__).resolve().parent / "assets/logo_.jpg"
 if logo_path.is_file():
     col1, col2, col3 = st.sidebar.columns([1,2,1])
     with col2:
-        st.image(str(logo_path), width=180)
+        st.image(read_bytes(logo_path), width=180)
 else:
     st.sidebar.error(f"Logo not found at {logo_path}")
 
@@ -119,6 +133,14 @@ Model Accuracy: 79.2%
 </div>
 """, unsafe_allow_html=True)
 
+model_cache = cache_info(model_path, model_kind)
+cache_totals = cache_info()
+st.sidebar.caption(
+    f"Model load time: {model_cache['load_time'] * 1000:.0f} ms • "
+    f"Model cache hits: {model_cache['hits']} • "
+    f"Resource cache: {cache_totals['hits']} hits / {cache_totals['misses']} loads"
+)
+
 
 
 # --- Team ---
@@ -313,13 +335,24 @@ with col2:
     )
 
     if uploaded_file is not None:
-        ok, text = extract_text_from_pdf(uploaded_file)
+        # parsed by the shared ingestion workers, not this session's thread
+        ingest = get_ingest_queue()
+        ok, job_id = ingest.submit(uploaded_file)
 
-        if ok:
-            extracted_text = text
-            st.success(f"Uploaded: {uploaded_file.name}")
+        if not ok:
+            st.warning(job_id)
         else:
-            st.error("Could not read this PDF. Try another resume.")
+            position = ingest.poll(job_id).get("position")
+            waiting = f"Reading resume PDF (queue position {position})..." if position else "Reading resume PDF..."
+
+            with st.spinner(waiting):
+                ok, text = ingest.result(job_id)
+
+            if ok:
+                extracted_text = text
+                st.success(f"Uploaded: {uploaded_file.name}")
+            else:
+                st.error(f"{text} Try another resume.")
 
     # 🔹 Lock typing if PDF uploaded
     if extracted_text != "":
@@ -364,116 +397,52 @@ def show_tags(skills, color="#e8f4ff"):
 # ---------------- ANALYZE ----------------
 if st.button("Analyze"):
 
-    # ---------- VALIDATION ----------
-    if not resume_text.strip():
-        st.error("Please paste resume text.")
-        st.stop()
-
-    if not job_description.strip():
-        st.error("Please provide job description.")
-        st.stop()
-    
     with st.spinner("Analyzing profile..."):
 
-        progress = st.progress(0)
-
-        st.write(" Extracting resume skills...")
-        time.sleep(0.6)
-        progress.progress(25)
+        progress = st.empty()
 
-        st.write(" Matching with job description...")
-        time.sleep(0.6)
-        progress.progress(50)
-
-        st.write(" Running placement prediction model...")
-        time.sleep(0.6)
-        progress.progress(75)
-
-        st.write(" Generating improvement roadmap...")
-        time.sleep(0.6)
-        progress.progress(100)
-
-        #SKILLS EXTRACTOR
-        resume_skills, job_skills = extract_skills(resume_text, job_description)
-        # -------- ATS KEYWORD SCORE --------
-        jd_keywords = extract_keywords(job_description)
-        resume_keywords = extract_keywords(resume_text)
-
-        matched_keywords = set(jd_keywords) & set(resume_keywords)
-        missing_keywords = set(jd_keywords) - set(resume_keywords)
-
-        if len(jd_keywords) > 0:
-            ats_score = round(len(matched_keywords) / len(jd_keywords) * 100, 2)
-        else:
-            ats_score = 0
-
-        # ---------- RESUME QUALITY ----------   # out of 10
-        resume_quality = calculate_resume_quality(resume_text, resume_skills)
-        
-        # ---- Resume Validation ----
-
-        text = resume_text.strip()
-
-        if text == "":
-            st.error("Please paste your resume.")
-            st.stop()
+        def show_stage(message, percent):
+            st.write(message)
+            progress.progress(percent)
 
-        words = text.lower().split()
+        from core.analysis import analyze_profile
 
-        # garbage like "asdfgh"
-        if len(words) <= 1:
-            st.error("Resume text seems invalid.")
-            st.stop()
-
-        # repeated spam like "python python python"
-        if len(set(words)) <= 1:
-            st.error("Resume text looks like repeated spam.")
-            st.stop()
-
-        # few skills → just warn
-        if len(resume_skills) == 0:
-            st.warning("No recognizable technical skills found.")
-        elif len(resume_skills) <= 2:
-            st.info("Few skills detected. Consider adding more skills.")
-
-
-        # ---------- SMART RESUME VALIDATION ----------
-        is_valid, msg = validate_resume_text(resume_text)
-
-        if not is_valid:
-            st.error(msg)
-            st.stop()
-
-        match_percentage = 0
-        if len(job_skills) > 0:
-            match_percentage = round(
-                (len(set(resume_skills).intersection(job_skills)) / len(job_skills)) * 100, 2
-            )
-
-        missing_skills = list(set(job_skills) - set(resume_skills))
-
-        # ---------- MODEL ----------
-        ok, result = predict_placement(
-            model,
-            cgpa,
-            internship,
-            communication,
-            match_percentage,
-            projects,
-            dsa_score,
-            resume_quality,
-            hackathons,
-            role,
-            role_difficulty
+        ok, analysis = analyze_profile(
+            model, cgpa, internship, projects, communication, dsa_score,
+            hackathons, role, resume_text, job_description,
+            model_version=file_version(model_path),
+            on_stage=show_stage
         )
 
         if not ok:
-            st.error("Prediction failed. Please check inputs.")
-            st.caption(result)   # optional debug
+            st.error(analysis)
             st.stop()
 
-        probability = result
+        if analysis["cached"]:
+            st.caption("Loaded from analysis cache — inputs unchanged since a previous run.")
+        else:
+            progress.progress(100)
+            stage_times = analysis["stage_times"]
+            st.session_state.stage_times = stage_times
+
+            with st.expander("Stage timings"):
+                for stage, seconds in stage_times.items():
+                    st.write(f"{stage}: {seconds * 1000:.2f} ms")
+                st.caption(f"Total: {sum(stage_times.values()) * 1000:.2f} ms")
+
+        resume_skills = analysis["resume_skills"]
+        matched_keywords = analysis["matched_keywords"]
+        missing_keywords = analysis["missing_keywords"]
+        ats_score = analysis["ats_score"]
+        resume_quality = analysis["resume_quality"]
+        match_percentage = analysis["match_percentage"]
+        missing_skills = analysis["missing_skills"]
+        probability = analysis["probability"]
 
+        # few skills → just warn
+        if analysis["skill_note"]:
+            level, message = analysis["skill_note"]
+            getattr(st, level)(message)
 
 
         st.divider()
@@ -526,40 +495,10 @@ if st.button("Analyze"):
         # ---------- WHY THIS SCORE ----------
         st.subheader(" Why this score?")
 
-        reasons = []
-
-        if cgpa >= 8:
-            reasons.append(f"Strong CGPA (+{round(cgpa*1.5,1)}%)")
-        elif cgpa < 6.5:
-            reasons.append("Low CGPA (-8%)")
-
-        if internship == 1:
-            reasons.append("Internship experience (+10%)")
-        else:
-            reasons.append("No internship (-10%)")
-
-        if match_percentage >= 70:
-            reasons.append(f"Good skill match (+{round(match_percentage/5,1)}%)")
-        elif match_percentage < 40:
-            reasons.append("Low skill match (-10%)")
-
-        if communication >= 7:
-            reasons.append("Good communication (+6%)")
-        elif communication <= 4:
-            reasons.append("Weak communication (-6%)")
-
-        if dsa_score >= 7:
-            reasons.append("Strong DSA skills (+8%)")
-        elif dsa_score <= 3:
-            reasons.append("Weak DSA skills (-8%)")
-
-        if hackathons >= 2:
-            reasons.append("Certifications/Hackathons (+5%)")
-
-        if len(reasons) == 0:
+        if len(analysis["score_factors"]) == 0:
             st.write("Balanced profile with no major strengths or weaknesses.")
         else:
-            for r in reasons:
+            for r in analysis["score_factors"]:
                 st.write("•", r)
 
 
@@ -570,43 +509,13 @@ if st.button("Analyze"):
 
         st.progress(int(resume_quality * 10))
 
-        if resume_quality < 4:
-            st.warning("Resume needs major improvement.")
-        elif resume_quality < 7:
-            st.info("Resume is decent but can be improved.")
-        else:
-            st.success("Strong resume structure.")
+        level, message = analysis["resume_strength"]
+        getattr(st, level)(message)
 
 
         st.subheader(" Why This Score?")
 
-        reasons = []
-
-        if cgpa >= 8:
-            reasons.append("Strong academic performance boosted your score.")
-        elif cgpa < 6.5:
-            reasons.append("Low CGPA reduced your placement chances.")
-
-        if internship == 1:
-            reasons.append("Internship experience increased industry readiness.")
-        else:
-            reasons.append("No internship experience lowered real-world exposure.")
-
-        if match_percentage >= 70:
-            reasons.append("Your skills match the job requirements well.")
-        elif match_percentage < 40:
-            reasons.append("Low skill match with job description reduced score.")
-
-        if dsa_score >= 7:
-            reasons.append("Strong DSA/problem solving is a big advantage.")
-            
-        if hackathons >= 2:
-            reasons.append("Hackathons/certifications improved profile strength.")
-
-        if resume_quality >= 7:
-            reasons.append("Well-structured resume improved recruiter impression.")
-
-        for r in reasons:
+        for r in analysis["score_reasons"]:
             st.write("•", r)
 
 
@@ -621,9 +530,13 @@ if st.button("Analyze"):
 
 
         st.subheader("Skill Profile")
+        skill_profile = analysis["skill_profile"]
+
+        import pandas as pd
+
         skills_df = pd.DataFrame({
-            "Category": ["CGPA", "Projects", "Skill Match", "Communication"],
-            "Score": [cgpa*10, projects*20, match_percentage, communication*10]
+            "Category": list(skill_profile),
+            "Score": list(skill_profile.values())
         })
         st.bar_chart(skills_df.set_index("Category"))
 
@@ -635,12 +548,8 @@ if st.button("Analyze"):
         else:
             st.success("No major skill gaps detected.")
 
-        if probability >= 80:
-            st.success("High Placement Readiness")
-        elif probability >= 50:
-            st.warning("Moderate Placement Readiness")
-        else:
-            st.error("Low Placement Readiness - Improvement Required")
+        level, message = analysis["readiness"]
+        getattr(st, level)(message)
 
         st.divider()
         st.info(
@@ -652,47 +561,12 @@ if st.button("Analyze"):
         st.divider()
         st.subheader(" Why This Score?")
 
-        strengths = []
-        improvements = []
-
-        if cgpa >= 8:
-            strengths.append("Strong CGPA")
-        else:
-            improvements.append("Improve academic performance")
-
-        if internship == 1:
-            strengths.append("Internship experience")
-        else:
-            improvements.append("Get internship experience")
-
-        if match_percentage >= 70:
-            strengths.append("Good skill match with job role")
-        elif match_percentage >= 40:
-            improvements.append("Improve skill match with job role")
-        else:
-            improvements.append("Major skill gaps for target role")
-
-        if dsa_score >= 7:
-            strengths.append("Good Dsa / Coding ability")
-        else:
-            improvements.append("Practice Dsa problems")
-
-        if hackathons >= 2:
-            strengths.append("Active in hackathons / certifications")
-        else:
-            improvements.append("Do certifications or hackathons")
-
-        if resume_quality >= 7:
-            strengths.append("Strong resume quality")
-        else:
-            improvements.append("Improve resume structure and achievements")
-
         st.markdown("### Strengths")
-        for s in strengths:
+        for s in analysis["strengths"]:
             st.success(f"▸ {s}")
 
         st.markdown("### Needs Improvement")
-        for i in improvements:
+        for i in analysis["improvements"]:
             st.warning(f"▸ {i}")
 
         # ---------- INSIGHT PANEL ----------
@@ -709,24 +583,7 @@ if st.button("Analyze"):
         # ---------- STRENGTHS ----------
         with col1:
 
-            strengths = []
-
-            if cgpa >= 8:
-                strengths.append("Strong academic performance")
-            if internship == 1:
-                strengths.append("Internship experience adds real-world exposure")
-            if len(resume_skills) >= 4:
-                strengths.append("Good skill coverage for the role")
-            if dsa_score >= 7:
-                strengths.append("Strong problem-solving ability")
-            if hackathons >= 2:
-                strengths.append("Active in hackathons / certifications")
-
-            if not strengths:
-
-                strengths.append("Keep Hustling Hard !!")
-
-            html = "<br>".join([f"• {s}" for s in strengths])
+            html = "<br>".join([f"• {s}" for s in analysis["insight_strengths"]])
 
             st.markdown(
                 f"""
@@ -742,23 +599,7 @@ if st.button("Analyze"):
         # ---------- WEAK AREAS ----------
         with col2:
 
-            weak = []
-
-            if cgpa < 7:
-                weak.append("Low CGPA may affect shortlist chances")
-            if internship == 0:
-                weak.append("No internship experience")
-            if len(resume_skills) <= 2:
-                weak.append("Limited technical skills detected")
-            if match_percentage < 50:
-                weak.append("Resume not aligned with job role")
-            if dsa_score <= 5:
-                weak.append("Improve coding/problem-solving skills")
-
-            if not weak:
-                weak.append("No major weak areas — keep growing 🔥")
-
-            html = "<br>".join([f"• {w}" for w in weak])
+            html = "<br>".join([f"• {w}" for w in analysis["weak_areas"]])
 
             st.markdown(
                 f"""
@@ -774,77 +615,43 @@ if st.button("Analyze"):
         
         st.subheader(" Exact Next Steps")
 
-        if match_percentage < 60:
-            st.write("• Add missing skills from job description")
-
-        if internship == 0:
-            st.write("• Try 1–2 internships or open-source projects")
-
-        if dsa_score < 7:
-            st.write("• Solve 150+ DSA problems on LeetCode")
-
-        if resume_quality < 6:
-            st.write("• Add quantified achievements (numbers, impact)")
-
-        if hackathons < 2:
-            st.write("• Participate in hackathons or certifications")
-
-        if cgpa < 7.5:
-            st.write("• Focus on academics next semester")
-
-        st.write("• Do mock interviews weekly")
-        st.write("• Build 1 real-world project")
+        for step in analysis["next_steps"]:
+            st.write(f"• {step}")
         
 
         st.subheader("Learning Roadmap")
 
-        ROADMAP_LIBRARY = {
-            "python": "Complete Python OOP and build 2 mini projects.",
-            "sql": "Practice SQL joins and queries.",
-            "machine learning": "Build one ML project.",
-            "data analysis": "Learn Pandas + visualization.",
-            "git": "Learn Git branching and maintain repo.",
-            "communication": "Practice mock interviews.",
-            "data structures": "Solve 100+ DSA problems."
-        }
-
         if missing_skills:
-            for skill in missing_skills:
-                if skill in ROADMAP_LIBRARY:
-                    st.write("•", ROADMAP_LIBRARY[skill])
+            for step in analysis["roadmap"]:
+                st.write("•", step)
         else:
             st.write("No major skill gaps. Focus on advanced projects.")
         
         # ---------- Recruiter Recommendation ----------
         st.subheader(" Recruiter Recommendation")
 
-        if probability >= 85:
-            st.success("Ready to apply to top product companies.")
-        elif probability >= 65:
-            st.info("Ready for mid-tier companies. Improve 1-2 skills for top companies.")
-        else:
-            st.warning("Focus on internships, DSA, and skill matching before applying.")
+        level, message = analysis["recommendation"]
+        getattr(st, level)(message)
 
         # ---------- Company Readiness ----------
         st.subheader(" Company Readiness")
 
-        company_targets = {
-            "Amazon SDE": 1.2,
-            "Google SWE": 1.25,
-            "Infosys Graduate Engineer": 0.9,
-            "Startup Intern": 0.8
-        }
-
-        for company, difficulty in company_targets.items():
-            company_score = probability / difficulty
-            company_score = round(max(5, min(company_score, 95)), 1)
-
-            if company_score >= 85:
-                st.success(f"{company} → {company_score}% Ready")
-            elif company_score >= 65:
-                st.info(f"{company} → {company_score}% Almost Ready")
-            else:
-                st.warning(f"{company} → {company_score}% Needs Improvement")
+        for target in analysis["company_readiness"]:
+            getattr(st, target["level"])(
+                f"{target['company']} → {target['score']}% {target['label']}"
+            )
+
+        # ---------- Best-Fit Roles ----------
+        st.subheader(" Best-Fit Roles")
+
+        if analysis["ranked_roles"]:
+            for fit in analysis["ranked_roles"]:
+                st.write(
+                    f"• {fit['role']} → {fit['probability']}% "
+                    f"(Skill match {fit['match_percentage']}%, ATS {fit['ats_score']}%)"
+                )
+        else:
+            st.caption("Best-fit roles unavailable.")
 
 # ---------------- FOOTER ----------------
 st.markdown("---")
@@ -0,0 +1,100 @@
+# Burst of simultaneous resume uploads through the ingestion queue vs. every
+# session parsing its own upload inline.
+#
+#   python -m benchmarks.bench_ingest [--uploads N] [--workers W]
+#       [--max-pending P] [--pages K]
+#
+# Each upload is a distinct PDF (so neither the cache nor job de-duplication
+# kicks in). Clients that are pushed back retry after a short pause, the way
+# a student would click again.
+
+import argparse
+import os
+import threading
+import time
+
+import numpy as np
+
+from benchmarks.pdf_fixtures import make_pdf
+from data.demo_profiles import STRONG_RESUME
+from utils.ingest import IngestQueue
+from utils.pdf_reader import extract_text_from_pdf
+
+RETRY_PAUSE = 1.0
+
+
+def make_uploads(n, pages):
+    lines = [l for l in STRONG_RESUME.strip().splitlines() if l]
+    return [make_pdf(pages, [f"Applicant {i}"] + lines) for i in range(n)]
+
+
+def run_clients(uploads, handle):
+    latencies = [None] * len(uploads)
+
+    def client(i):
+        start = time.perf_counter()
+        handle(uploads[i])
+        latencies[i] = time.perf_counter() - start
+
+    threads = [threading.Thread(target=client, args=(i,)) for i in range(len(uploads))]
+    start = time.perf_counter()
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+
+    return time.perf_counter() - start, np.array(latencies)
+
+
+def report(name, elapsed, latencies, extra=""):
+    print(f"{name:<8} {elapsed:8.2f}s   p50 {np.percentile(latencies, 50):7.2f}s   "
+          f"p99 {np.percentile(latencies, 99):7.2f}s   {extra}")
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--uploads", type=int, default=1000)
+    parser.add_argument("--workers", type=int, default=os.cpu_count() or 1)
+    parser.add_argument("--max-pending", type=int, default=64)
+    parser.add_argument("--pages", type=int, default=2)
+    parser.add_argument("--inline", type=int, default=200,
+                        help="uploads for the inline baseline (0 to skip)")
+    args = parser.parse_args()
+
+    uploads = make_uploads(args.uploads, args.pages)
+    print(f"{args.uploads} uploads of {args.pages} page(s), {args.workers} worker(s), "
+          f"cpu_count={os.cpu_count()}")
+
+    ingest = IngestQueue(workers=args.workers, max_pending=args.max_pending)
+    pushed_back = [0]
+    failures = [0]
+
+    def via_queue(data):
+        while True:
+            ok, job_id = ingest.submit(data)
+            if ok:
+                break
+            pushed_back[0] += 1
+            time.sleep(RETRY_PAUSE)
+
+        ok, _ = ingest.result(job_id)
+        if not ok:
+            failures[0] += 1
+
+    elapsed, latencies = run_clients(uploads, via_queue)
+    stats = ingest.stats()
+    report("queue", elapsed, latencies,
+           f"done {stats['done']}, pushed back {pushed_back[0]} times, failed {failures[0]}")
+    ingest.close()
+
+    if args.inline:
+        # every session parses on its own thread, all at once
+        subset = make_uploads(args.inline, args.pages)
+        elapsed, latencies = run_clients(
+            subset, lambda data: extract_text_from_pdf(data, use_cache=False)
+        )
+        report("inline", elapsed, latencies, f"({args.inline} uploads, all parsing concurrently)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,54 @@
+# Serial vs process-pool page extraction on synthetic 1-, 5- and 50-page
+# PDFs. The cache is bypassed so every run really parses the document.
+#
+#   python -m benchmarks.bench_pdf_reader [--workers N]
+
+import argparse
+import io
+import os
+import time
+
+from benchmarks.pdf_fixtures import make_pdf
+from utils.pdf_reader import extract_text_from_pdf
+
+
+def timeit(data, workers, repeat):
+    best = float("inf")
+    text = None
+
+    for _ in range(repeat):
+        start = time.perf_counter()
+        ok, text = extract_text_from_pdf(io.BytesIO(data), use_cache=False, workers=workers)
+        best = min(best, time.perf_counter() - start)
+        assert ok
+
+    return best, text
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--workers", type=int, default=os.cpu_count() or 1)
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+
+    print(f"workers={args.workers}  cpu_count={os.cpu_count()}")
+    print(f"{'pages':>6} {'serial (ms)':>13} {'parallel (ms)':>15} {'speedup':>9}")
+
+    # warm the pool so process start-up is not billed to the first document
+    extract_text_from_pdf(io.BytesIO(make_pdf(50)), use_cache=False, workers=args.workers)
+
+    for pages in (1, 5, 50):
+        data = make_pdf(pages)
+
+        t_serial, serial_text = timeit(data, 1, args.repeat)
+        t_parallel, parallel_text = timeit(data, args.workers, args.repeat)
+        assert serial_text == parallel_text
+
+        print(
+            f"{pages:>6} {t_serial * 1000:>13.1f} {t_parallel * 1000:>15.1f} "
+            f"{t_serial / t_parallel:>8.2f}x"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,58 @@
+# Scalar calculate_resume_quality loop vs. the pandas batch version.
+#
+#   python -m benchmarks.bench_resume_quality [--rows N]
+
+import argparse
+import random
+import time
+
+import numpy as np
+import pandas as pd
+
+from data.demo_profiles import AVERAGE_RESUME, STRONG_RESUME, WEAK_RESUME
+from nlp.resume_quality import calculate_resume_quality, calculate_resume_quality_batch
+
+
+def make_resumes(n, rng):
+    lines = [
+        line
+        for resume in (STRONG_RESUME, AVERAGE_RESUME, WEAK_RESUME)
+        for line in resume.strip().splitlines()
+    ]
+    return [
+        "\n".join(rng.choices(lines, k=rng.randint(1, 40))) + f" {rng.randint(0, 999)}"
+        for _ in range(n)
+    ]
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--rows", type=int, default=100_000)
+    args = parser.parse_args()
+
+    rng = random.Random(11)
+    texts = pd.Series(make_resumes(args.rows, rng))
+    skill_counts = pd.Series([rng.randint(0, 10) for _ in range(args.rows)])
+
+    # warm the regex character classes
+    calculate_resume_quality_batch(texts.head(1), skill_counts.head(1))
+
+    start = time.perf_counter()
+    scalar = np.array([
+        calculate_resume_quality(t, [None] * n) for t, n in zip(texts, skill_counts)
+    ])
+    t_scalar = time.perf_counter() - start
+
+    start = time.perf_counter()
+    batch = calculate_resume_quality_batch(texts, skill_counts)
+    t_batch = time.perf_counter() - start
+
+    assert np.array_equal(scalar, batch)
+
+    print(f"{args.rows:,} resumes")
+    print(f"scalar loop: {t_scalar:.3f} s")
+    print(f"batch:       {t_batch:.3f} s  ({t_scalar / t_batch:.1f}x)")
+
+
+if __name__ == "__main__":
+    main()
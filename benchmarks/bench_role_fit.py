@@ -0,0 +1,67 @@
+# Best-fit role ranking latency as the role catalog grows.
+#
+#   python -m benchmarks.bench_role_fit
+
+import random
+import time
+import warnings
+
+import joblib
+
+from config.roles import role_descriptions, role_difficulty
+from data.demo_profiles import STRONG_RESUME
+from models.role_fit import RoleFitEngine
+from nlp.role_index import build_role_index
+from nlp.skill_extractor import SKILLS
+
+
+def make_catalog(size, rng):
+    lines = [
+        line.strip()
+        for jd in role_descriptions.values()
+        for line in jd.strip().splitlines()
+    ]
+    aliases = [a for skill_aliases in SKILLS.values() for a in skill_aliases]
+
+    descriptions = {}
+    difficulty = {}
+    for i in range(size):
+        role = f"Role {i}"
+        text = rng.sample(lines, 4) + [", ".join(rng.sample(aliases, 6))]
+        descriptions[role] = "\n".join(text)
+        difficulty[role] = rng.choice(list(role_difficulty.values()))
+
+    return descriptions, difficulty
+
+
+def main():
+    warnings.filterwarnings("ignore")
+    rng = random.Random(7)
+    model = joblib.load("models/placement_model.pkl")
+
+    print(f"{'roles':>7} {'build (ms)':>12} {'rank (ms)':>11}")
+
+    for size in (23, 500, 2000, 5000):
+        if size == len(role_descriptions):
+            descriptions, difficulty = role_descriptions, role_difficulty
+        else:
+            descriptions, difficulty = make_catalog(size, rng)
+
+        start = time.perf_counter()
+        engine = RoleFitEngine(build_role_index(descriptions, difficulty))
+        build = time.perf_counter() - start
+
+        engine.rank(model, STRONG_RESUME, 8.0, 1, 3, 7, 6, 2)
+
+        repeat = 50
+        start = time.perf_counter()
+        for _ in range(repeat):
+            ok, ranked = engine.rank(model, STRONG_RESUME, 8.0, 1, 3, 7, 6, 2)
+        rank = (time.perf_counter() - start) / repeat
+        assert ok
+
+        print(f"{size:>7} {build * 1000:>12.1f} {rank * 1000:>11.2f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,124 @@
+# Compares the Aho-Corasick skill matcher against the original
+# per-keyword substring loop.
+#
+#   python -m benchmarks.bench_skill_extractor
+#
+# Before timing, the real taxonomy is checked against WORD_CASES: skills
+# whose aliases are whole words must not fire inside longer words.
+
+import random
+import string
+import time
+
+from data.demo_profiles import STRONG_RESUME, STRONG_JD
+from nlp.aho_corasick import has_word
+from nlp.skill_extractor import SKILLS, WHOLE_WORDS, build_skill_matcher, find_skills
+
+
+# text -> skills find_skills must return for it
+WORD_CASES = {
+    "reactive systems, guardrails": [],
+    "reaction time": [],
+    "assassin": [],
+    "HTML5 and XML": ["html"],
+    "digital signal processing": [],
+    "schematic capture": [],
+    "sparkling water, blowtorch": [],
+    "fragile therapist": [],
+    "power bill, basic programming in your language": [],
+    "Deployed on AWS.": ["aws"],
+    "OOP concepts in Java": ["java", "oop"],
+    "React, Rails, Sass, Spark, torch, Git": ["git", "ruby", "css", "react", "big data", "pytorch"],
+}
+
+
+def check_word_cases():
+    for text, expected in WORD_CASES.items():
+        found = find_skills(text)
+        assert found == expected, f"find_skills({text!r}) = {found}, expected {expected}"
+
+
+def naive_extract_skills(resume_text, job_description, skills):
+    resume_clean = resume_text.lower()
+    job_clean = job_description.lower()
+
+    def hit(k, text):
+        return has_word(text, k) if k in WHOLE_WORDS else k in text
+
+    resume_skills = []
+    job_skills = []
+
+    for skill, keywords in skills.items():
+        if any(hit(k, resume_clean) for k in keywords):
+            resume_skills.append(skill)
+
+        if any(hit(k, job_clean) for k in keywords):
+            job_skills.append(skill)
+
+    return resume_skills, job_skills
+
+
+def make_taxonomy(size, rng):
+    skills = dict(list(SKILLS.items())[:size])
+
+    while len(skills) < size:
+        name = "".join(rng.choices(string.ascii_lowercase, k=rng.randint(6, 12)))
+        aliases = [
+            "".join(rng.choices(string.ascii_lowercase, k=rng.randint(5, 12)))
+            for _ in range(rng.randint(1, 3))
+        ]
+        skills[name] = [name] + aliases
+
+    return skills
+
+
+def make_text(base, skills, rng, n_skills=15):
+    words = base.split()
+    extra = rng.sample(list(skills.values()), min(n_skills, len(skills)))
+    words += [rng.choice(aliases) for aliases in extra]
+    rng.shuffle(words)
+    return " ".join(words)
+
+
+def timeit(fn, repeat):
+    start = time.perf_counter()
+    for _ in range(repeat):
+        fn()
+    return (time.perf_counter() - start) / repeat
+
+
+def main():
+    check_word_cases()
+    rng = random.Random(42)
+
+    print(f"{'skills':>8} {'loop (ms)':>12} {'automaton (ms)':>16} {'build (ms)':>12} {'speedup':>9}")
+
+    for size in (6, 500, 5000):
+        skills = make_taxonomy(size, rng)
+        resume = make_text(STRONG_RESUME * 5, skills, rng)
+        jd = make_text(STRONG_JD, skills, rng)
+
+        start = time.perf_counter()
+        matcher = build_skill_matcher(skills)
+        build = time.perf_counter() - start
+
+        def automaton():
+            return find_skills(resume, matcher), find_skills(jd, matcher)
+
+        def loop():
+            return naive_extract_skills(resume, jd, skills)
+
+        assert automaton() == loop()
+
+        repeat = 200 if size < 1000 else 20
+        t_loop = timeit(loop, repeat)
+        t_auto = timeit(automaton, repeat)
+
+        print(
+            f"{size:>8} {t_loop * 1000:>12.3f} {t_auto * 1000:>16.3f} "
+            f"{build * 1000:>12.1f} {t_loop / t_auto:>8.1f}x"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,123 @@
+# Cold start of app.py, each run in a fresh interpreter:
+#   import  - time to import everything app.py imports at the top
+#   render  - time for the first full render of the page (AppTest, bare mode)
+# and which heavy modules the first render pulled in.
+#
+#   python -m benchmarks.bench_startup [--repeat N] [--app PATH]
+#       [--import-budget MS] [--render-budget MS]
+#
+# This is the startup regression check: it exits non-zero if the median
+# import/render time is over budget, or if the first render loaded any of
+# LAZY_MODULES (they should only load on first real use). The default
+# budgets sit between the lazy-import timings (~450 / ~550 ms) and the
+# eager ones they replaced (~960 / ~1050 ms) on a 1-CPU dev box; pass a
+# budget of 0 to skip that check on slower machines.
+
+import argparse
+import json
+import os
+import statistics
+import subprocess
+import sys
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+# must not be imported until an upload / Analyze / the skill chart needs them
+LAZY_MODULES = ["pandas", "pdfplumber", "scipy", "sklearn", "joblib"]
+
+IMPORT_BUDGET_MS = 750
+RENDER_BUDGET_MS = 850
+
+IMPORT_PROBE = """
+import ast, importlib, json, sys, time
+
+with open(sys.argv[1], encoding="utf-8") as f:
+    tree = ast.parse(f.read())
+
+names = []
+for node in tree.body:
+    if isinstance(node, ast.Import):
+        names += [alias.name for alias in node.names]
+    elif isinstance(node, ast.ImportFrom) and node.level == 0:
+        names.append(node.module)
+
+start = time.perf_counter()
+for name in names:
+    importlib.import_module(name)
+elapsed = time.perf_counter() - start
+
+print(json.dumps({"seconds": elapsed, "modules": sorted(sys.modules)}))
+"""
+
+RENDER_PROBE = """
+import json, sys, time, warnings
+warnings.filterwarnings("ignore")
+
+from streamlit.testing.v1 import AppTest
+
+before = set(sys.modules)
+start = time.perf_counter()
+at = AppTest.from_file(sys.argv[1], default_timeout=120).run()
+elapsed = time.perf_counter() - start
+
+print(json.dumps({
+    "seconds": elapsed,
+    "modules": sorted(set(sys.modules) - before),
+    "exception": [str(e.value) for e in at.exception],
+}))
+"""
+
+
+def probe(code, app):
+    env = dict(os.environ, PYTHONPATH=ROOT)
+    out = subprocess.run(
+        [sys.executable, "-c", code, app],
+        cwd=ROOT, env=env, capture_output=True, text=True, check=True
+    ).stdout
+    return json.loads(out.strip().splitlines()[-1])
+
+
+def loaded(modules):
+    return [m for m in LAZY_MODULES if m in modules]
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--app", default="app.py")
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--import-budget", type=float, default=IMPORT_BUDGET_MS, metavar="MS",
+                        help="fail if the median cold import takes longer (0 = no limit)")
+    parser.add_argument("--render-budget", type=float, default=RENDER_BUDGET_MS, metavar="MS",
+                        help="fail if the median first render takes longer (0 = no limit)")
+    args = parser.parse_args()
+
+    imports = [probe(IMPORT_PROBE, args.app) for _ in range(args.repeat)]
+    renders = [probe(RENDER_PROBE, args.app) for _ in range(args.repeat)]
+
+    import_ms = statistics.median(r["seconds"] for r in imports) * 1000
+    render_ms = statistics.median(r["seconds"] for r in renders) * 1000
+    eager = sorted(set(loaded(imports[0]["modules"])) | set(loaded(renders[0]["modules"])))
+
+    print(f"{args.app}, {args.repeat} cold runs each")
+    print(f"  import:        {import_ms:8.1f} ms (median)")
+    print(f"  first render:  {render_ms:8.1f} ms (median)")
+    print(f"  heavy modules loaded at startup: {', '.join(eager) or 'none'}")
+
+    failures = []
+    if renders[0]["exception"]:
+        failures.append(f"first render raised: {renders[0]['exception'][0]}")
+    if args.import_budget and import_ms > args.import_budget:
+        failures.append(f"import {import_ms:.1f} ms over budget {args.import_budget:.0f} ms")
+    if args.render_budget and render_ms > args.render_budget:
+        failures.append(f"first render {render_ms:.1f} ms over budget {args.render_budget:.0f} ms")
+    if eager:
+        failures.append(f"loaded eagerly: {', '.join(eager)}")
+
+    for failure in failures:
+        print("FAIL:", failure)
+
+    sys.exit(1 if failures else 0)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,165 @@
+# Local load test for serve.py: C concurrent keep-alive connections send N
+# requests in total, then client-side and server-side (/stats) latency
+# percentiles are printed.
+#
+#   python -m benchmarks.load_test --spawn --workers 2 [--requests N]
+#       [--concurrency C] [--batch-size B]
+#
+# --batch-size 0 (default) posts single profiles to /score; otherwise B
+# profiles per /score/batch call. Without --spawn, point --host/--port at
+# an already running server.
+
+import argparse
+import asyncio
+import json
+import random
+import subprocess
+import sys
+import time
+
+import numpy as np
+
+from config.roles import role_descriptions
+from data.demo_profiles import AVERAGE_RESUME, STRONG_RESUME, WEAK_RESUME
+
+
+def make_profile(rng):
+    return {
+        "cgpa": round(rng.uniform(5.0, 10.0), 2),
+        "internship": rng.randint(0, 1),
+        "projects": rng.randint(0, 5),
+        "communication": rng.randint(1, 10),
+        "dsa_score": rng.randint(1, 10),
+        "hackathons": rng.randint(0, 5),
+        "role": rng.choice(list(role_descriptions)),
+        "resume_text": rng.choice([STRONG_RESUME, AVERAGE_RESUME, WEAK_RESUME]),
+    }
+
+
+async def request(reader, writer, host, method, path, payload=None):
+    body = b"" if payload is None else json.dumps(payload).encode("utf-8")
+    writer.write(
+        f"{method} {path} HTTP/1.1\r\n"
+        f"Host: {host}\r\n"
+        "Content-Type: application/json\r\n"
+        f"Content-Length: {len(body)}\r\n"
+        "\r\n".encode("latin-1") + body
+    )
+    await writer.drain()
+
+    status = int((await reader.readline()).split()[1])
+    length = 0
+    while True:
+        line = await reader.readline()
+        if line in (b"\r\n", b"\n", b""):
+            break
+        name, _, value = line.decode("latin-1").partition(":")
+        if name.strip().lower() == "content-length":
+            length = int(value)
+
+    return status, json.loads(await reader.readexactly(length))
+
+
+async def client(host, port, jobs, latencies, failures):
+    reader, writer = await asyncio.open_connection(host, port)
+
+    try:
+        while jobs:
+            path, payload = jobs.pop()
+            start = time.perf_counter()
+            status, _ = await request(reader, writer, host, "POST", path, payload)
+            latencies.append(time.perf_counter() - start)
+            if status != 200:
+                failures.append(status)
+    finally:
+        writer.close()
+
+
+async def wait_for_server(host, port, timeout=60):
+    deadline = time.monotonic() + timeout
+
+    while True:
+        try:
+            _, writer = await asyncio.open_connection(host, port)
+            writer.close()
+            return
+        except OSError:
+            if time.monotonic() > deadline:
+                raise
+            await asyncio.sleep(0.2)
+
+
+async def run(args):
+    rng = random.Random(11)
+
+    if args.batch_size:
+        jobs = [
+            ("/score/batch", {"profiles": [make_profile(rng) for _ in range(args.batch_size)]})
+            for _ in range(args.requests)
+        ]
+    else:
+        jobs = [("/score", make_profile(rng)) for _ in range(args.requests)]
+
+    await wait_for_server(args.host, args.port)
+
+    latencies = []
+    failures = []
+    start = time.perf_counter()
+    await asyncio.gather(*[
+        client(args.host, args.port, jobs, latencies, failures)
+        for _ in range(args.concurrency)
+    ])
+    elapsed = time.perf_counter() - start
+
+    reader, writer = await asyncio.open_connection(args.host, args.port)
+    _, stats = await request(reader, writer, args.host, "GET", "/stats")
+    writer.close()
+
+    lat = np.array(latencies) * 1000
+    profiles = len(latencies) * max(args.batch_size, 1)
+    print(f"{len(latencies)} requests ({profiles} profiles) in {elapsed:.2f}s, "
+          f"concurrency {args.concurrency}, {len(failures)} failed")
+    print(f"  throughput:  {len(latencies) / elapsed:8.1f} req/s  "
+          f"{profiles / elapsed:10.1f} profiles/s")
+    print(f"  client p50:  {np.percentile(lat, 50):8.2f} ms   "
+          f"p99: {np.percentile(lat, 99):8.2f} ms")
+
+    for endpoint, entry in stats["endpoints"].items():
+        print(f"  server {endpoint}: {entry['count']} requests, "
+              f"p50 {entry['p50_ms']} ms, p99 {entry['p99_ms']} ms")
+
+    return 1 if failures else 0
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8000)
+    parser.add_argument("--requests", type=int, default=2000)
+    parser.add_argument("--concurrency", type=int, default=16)
+    parser.add_argument("--batch-size", type=int, default=0)
+    parser.add_argument("--spawn", action="store_true",
+                        help="start serve.py for the duration of the test")
+    parser.add_argument("--workers", type=int, default=1,
+                        help="scoring processes for the spawned server")
+    args = parser.parse_args()
+
+    server = None
+    if args.spawn:
+        server = subprocess.Popen([
+            sys.executable, "serve.py",
+            "--host", args.host, "--port", str(args.port), "--workers", str(args.workers),
+        ])
+
+    try:
+        code = asyncio.run(run(args))
+    finally:
+        if server is not None:
+            server.terminate()
+            server.wait()
+
+    sys.exit(code)
+
+
+if __name__ == "__main__":
+    main()
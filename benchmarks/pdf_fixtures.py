@@ -0,0 +1,62 @@
+# Minimal text-only PDF writer for benchmarks, so no PDF authoring
+# library is needed.
+
+from data.demo_profiles import STRONG_RESUME
+
+LINES_PER_PAGE = 40
+
+
+def _escape(line):
+    return line.replace("\\", "\\\\").replace("(", "\\(").replace(")", "\\)")
+
+
+def make_pdf(pages, lines=None):
+    lines = lines or [l for l in STRONG_RESUME.strip().splitlines() if l]
+
+    objects = [
+        b"<< /Type /Catalog /Pages 2 0 R >>",
+        None,  # page tree, filled in below
+        b"<< /Type /Font /Subtype /Type1 /BaseFont /Helvetica >>",
+    ]
+    page_ids = []
+
+    for p in range(pages):
+        body = [b"BT /F1 10 Tf 12 TL 50 770 Td"]
+        body.append(f"(Page {p + 1}) Tj T*".encode())
+        for i in range(LINES_PER_PAGE):
+            line = _escape(lines[(p + i) % len(lines)])
+            body.append(f"({line}) Tj T*".encode("latin-1", "replace"))
+        body.append(b"ET")
+        stream = b"\n".join(body)
+
+        objects.append(
+            b"<< /Length " + str(len(stream)).encode() + b" >>\nstream\n"
+            + stream + b"\nendstream"
+        )
+        content_id = len(objects)
+        objects.append(
+            b"<< /Type /Page /Parent 2 0 R /MediaBox [0 0 612 792] "
+            b"/Resources << /Font << /F1 3 0 R >> >> "
+            b"/Contents " + str(content_id).encode() + b" 0 R >>"
+        )
+        page_ids.append(len(objects))
+
+    kids = " ".join(f"{i} 0 R" for i in page_ids)
+    objects[1] = f"<< /Type /Pages /Kids [{kids}] /Count {pages} >>".encode()
+
+    out = bytearray(b"%PDF-1.4\n")
+    offsets = []
+    for i, obj in enumerate(objects, start=1):
+        offsets.append(len(out))
+        out += f"{i} 0 obj\n".encode() + obj + b"\nendobj\n"
+
+    xref = len(out)
+    out += f"xref\n0 {len(objects) + 1}\n0000000000 65535 f \n".encode()
+    for off in offsets:
+        out += f"{off:010d} 00000 n \n".encode()
+    out += (
+        f"trailer\n<< /Size {len(objects) + 1} /Root 1 0 R >>\n"
+        f"startxref\n{xref}\n%%EOF\n"
+    ).encode()
+
+    return bytes(out)
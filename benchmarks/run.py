@@ -0,0 +1,290 @@
+# Benchmark suite for the scoring hot paths: every function is timed on
+# small, typical and pathological inputs (a 50-page resume, a 10k-skill
+# taxonomy, a 10k-row batch) and the results are written as JSON.
+#
+#   python -m benchmarks.run [-o bench_results.json] [--baseline OLD.json]
+#       [--tolerance 0.25] [--only NAME] [--min-time S]
+#
+# With --baseline every case is compared against an earlier results file by
+# median time, and the run exits non-zero if any case got slower by more than
+# --tolerance (0.25 = 25%). Compare runs from the same machine only.
+
+import argparse
+import json
+import os
+import platform
+import random
+import statistics
+import subprocess
+import sys
+import time
+import warnings
+
+import numpy as np
+
+import nlp.skill_extractor as skill_extractor
+from benchmarks.bench_skill_extractor import make_taxonomy, make_text
+from benchmarks.pdf_fixtures import LINES_PER_PAGE, make_pdf
+from config.roles import role_difficulty
+from data.demo_profiles import (
+    AVERAGE_JD,
+    STRONG_JD,
+    STRONG_RESUME,
+    WEAK_RESUME,
+)
+from models.compact import compact_path, load_compact
+from models.predictor import predict_placement, predict_placement_batch
+from nlp.resume_quality import calculate_resume_quality
+from nlp.skill_extractor import extract_keywords, extract_skills
+from utils.pdf_reader import extract_text_from_pdf
+from utils.validation import validate_resume_text
+
+MODEL_PATH = "models/placement_model.pkl"
+
+MIN_RUNS = 5
+MAX_RUNS = 100_000
+SLOW_CASE = 2.0  # seconds; cases this slow stop after min_time, however few runs
+
+
+# ---------- INPUTS ----------
+def long_resume(pages):
+    # same text the 50-page PDF fixture carries, without the PDF
+    lines = [l for l in STRONG_RESUME.strip().splitlines() if l]
+    out = []
+    for p in range(pages):
+        out.append(f"Page {p + 1}")
+        out += [lines[(p + i) % len(lines)] for i in range(LINES_PER_PAGE)]
+    return "\n".join(out)
+
+
+def make_inputs():
+    rng = random.Random(42)
+    big_taxonomy = make_taxonomy(10_000, rng)
+
+    return {
+        "small_resume": WEAK_RESUME,
+        "typical_resume": STRONG_RESUME,
+        "long_resume": long_resume(50),
+        "spam_resume": "python " * 100_000,
+        "small_jd": AVERAGE_JD,
+        "typical_jd": STRONG_JD,
+        "big_taxonomy": big_taxonomy,
+        "big_taxonomy_resume": make_text(STRONG_RESUME * 5, big_taxonomy, rng, n_skills=200),
+        "big_taxonomy_jd": make_text(STRONG_JD, big_taxonomy, rng, n_skills=50),
+        "pdf_1": make_pdf(1),
+        "pdf_2": make_pdf(2),
+        "pdf_50": make_pdf(50),
+    }
+
+
+def with_taxonomy(skills, fn):
+    # extract_skills rebuilds its matcher when SKILLS is replaced; the
+    # warm-up call pays for that build, the timed calls don't
+    def run():
+        original = skill_extractor.SKILLS
+        skill_extractor.SKILLS = skills
+        try:
+            return fn()
+        finally:
+            skill_extractor.SKILLS = original
+    return run
+
+
+def batch_profiles(n, rng):
+    return {
+        "cgpa": rng.uniform(5.0, 10.0, n),
+        "internship": rng.randint(0, 2, n),
+        "communication": rng.randint(1, 11, n),
+        "match_percentage": rng.uniform(0, 100, n),
+        "projects": rng.randint(0, 6, n),
+        "dsa_score": rng.randint(1, 11, n),
+        "resume_quality": rng.uniform(0, 10, n),
+        "hackathons": rng.randint(0, 6, n),
+        "role": rng.choice(list(role_difficulty), n),
+    }
+
+
+def load_models():
+    import joblib
+
+    with warnings.catch_warnings():
+        warnings.simplefilter("ignore")
+        sklearn_model = joblib.load(MODEL_PATH)
+
+    compact_file = compact_path(MODEL_PATH)
+    compact = load_compact(compact_file) if os.path.exists(compact_file) else None
+    return compact, sklearn_model
+
+
+# ---------- CASES ----------
+def build_cases(inputs):
+    i = inputs
+    compact, sklearn_model = load_models()
+    profiles = batch_profiles(10_000, np.random.RandomState(0))
+
+    def predict(model):
+        return lambda: predict_placement(
+            model, 8.1, 1, 7, 65.0, 3, 7, 7.5, 2, "Software Engineer", role_difficulty
+        )
+
+    cases = {
+        ("extract_skills", "small"): lambda: extract_skills(i["small_resume"], i["small_jd"]),
+        ("extract_skills", "typical"): lambda: extract_skills(i["typical_resume"], i["typical_jd"]),
+        ("extract_skills", "50_pages"): lambda: extract_skills(i["long_resume"], i["typical_jd"]),
+        ("extract_skills", "10k_skills"): with_taxonomy(
+            i["big_taxonomy"],
+            lambda: extract_skills(i["big_taxonomy_resume"], i["big_taxonomy_jd"])
+        ),
+
+        ("extract_keywords", "small"): lambda: extract_keywords(i["small_jd"]),
+        ("extract_keywords", "typical"): lambda: extract_keywords(i["typical_resume"]),
+        ("extract_keywords", "50_pages"): lambda: extract_keywords(i["long_resume"]),
+
+        ("calculate_resume_quality", "small"):
+            lambda: calculate_resume_quality(i["small_resume"], ["python"]),
+        ("calculate_resume_quality", "typical"):
+            lambda: calculate_resume_quality(i["typical_resume"], ["python", "sql", "ml"]),
+        ("calculate_resume_quality", "50_pages"):
+            lambda: calculate_resume_quality(i["long_resume"], ["python", "sql", "ml"]),
+
+        ("validate_resume_text", "small"): lambda: validate_resume_text(i["small_resume"]),
+        ("validate_resume_text", "typical"): lambda: validate_resume_text(i["typical_resume"]),
+        ("validate_resume_text", "50_pages"): lambda: validate_resume_text(i["long_resume"]),
+        ("validate_resume_text", "spam"): lambda: validate_resume_text(i["spam_resume"]),
+
+        ("extract_text_from_pdf", "1_page"):
+            lambda: extract_text_from_pdf(i["pdf_1"], use_cache=False),
+        ("extract_text_from_pdf", "2_pages"):
+            lambda: extract_text_from_pdf(i["pdf_2"], use_cache=False),
+        ("extract_text_from_pdf", "50_pages"):
+            lambda: extract_text_from_pdf(i["pdf_50"], use_cache=False),
+    }
+
+    if compact is not None:
+        cases[("predict_placement", "compact")] = predict(compact)
+    cases[("predict_placement", "sklearn")] = predict(sklearn_model)
+    cases[("predict_placement_batch", "10k_rows")] = (
+        lambda: predict_placement_batch(compact or sklearn_model, profiles, role_difficulty)
+    )
+
+    return cases
+
+
+# ---------- TIMING ----------
+def measure(fn, min_time):
+    fn()  # warm-up: lazy imports, matcher builds
+
+    times = []
+    total = 0.0
+    while len(times) < MAX_RUNS:
+        start = time.perf_counter()
+        fn()
+        elapsed = time.perf_counter() - start
+
+        times.append(elapsed)
+        total += elapsed
+        if total >= min_time and (len(times) >= MIN_RUNS or total >= SLOW_CASE):
+            break
+
+    return {
+        "median_ms": statistics.median(times) * 1000,
+        "min_ms": min(times) * 1000,
+        "mean_ms": total / len(times) * 1000,
+        "runs": len(times),
+    }
+
+
+def git_commit():
+    try:
+        return subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"],
+            capture_output=True, text=True, check=True
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def compare(results, baseline, tolerance):
+    regressions = []
+
+    for key, entry in results.items():
+        old = baseline.get(key)
+        if old is None:
+            entry["baseline_ms"] = None
+            continue
+
+        ratio = entry["median_ms"] / old["median_ms"]
+        entry["baseline_ms"] = old["median_ms"]
+        entry["ratio"] = round(ratio, 3)
+        entry["regression"] = ratio > 1 + tolerance
+        if entry["regression"]:
+            regressions.append(key)
+
+    return regressions
+
+
+def print_table(results):
+    print(f"{'case':<42} {'median (ms)':>12} {'min (ms)':>10} {'runs':>7} {'baseline':>10} {'ratio':>7}")
+
+    for key, entry in results.items():
+        line = (f"{key:<42} {entry['median_ms']:>12.4f} {entry['min_ms']:>10.4f} "
+                f"{entry['runs']:>7}")
+        if entry.get("baseline_ms") is not None:
+            flag = "  REGRESSION" if entry["regression"] else ""
+            line += f" {entry['baseline_ms']:>10.4f} {entry['ratio']:>6.2f}x{flag}"
+        print(line)
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("-o", "--output", default="bench_results.json")
+    parser.add_argument("--baseline", help="earlier results JSON to compare against")
+    parser.add_argument("--tolerance", type=float, default=0.25,
+                        help="allowed slowdown vs. baseline before failing (0.25 = 25%%)")
+    parser.add_argument("--only", action="append", metavar="NAME",
+                        help="run only cases whose function name matches (repeatable)")
+    parser.add_argument("--min-time", type=float, default=0.5,
+                        help="seconds to spend timing each case")
+    args = parser.parse_args()
+
+    # predict_placement passes a plain array to the pipeline fitted on a frame
+    warnings.filterwarnings("ignore", message="X does not have valid feature names")
+
+    cases = build_cases(make_inputs())
+
+    results = {}
+    for (name, size), fn in cases.items():
+        if args.only and name not in args.only:
+            continue
+        results[f"{name}/{size}"] = measure(fn, args.min_time)
+
+    regressions = []
+    if args.baseline:
+        with open(args.baseline, encoding="utf-8") as f:
+            baseline = json.load(f)["results"]
+        regressions = compare(results, baseline, args.tolerance)
+
+    print_table(results)
+
+    report = {
+        "created": time.strftime("%Y-%m-%dT%H:%M:%S"),
+        "commit": git_commit(),
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "cpu_count": os.cpu_count(),
+        "baseline": args.baseline,
+        "tolerance": args.tolerance if args.baseline else None,
+        "regressions": regressions,
+        "results": results,
+    }
+    with open(args.output, "w", encoding="utf-8") as f:
+        json.dump(report, f, indent=2)
+    print(f"\nResults written to {args.output}")
+
+    if regressions:
+        print(f"{len(regressions)} regression(s) over {args.tolerance:.0%}: {', '.join(regressions)}")
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
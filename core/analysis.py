@@ -0,0 +1,494 @@
+# UI-free analysis core: everything the Analyze button shows, computed from
+# the profile inputs without importing Streamlit.
+#
+# analyze_profile() returns (ok, result). Threshold checks on the profile
+# are evaluated once into `signals`; every list the UI shows (score factors,
+# strengths, weak areas, next steps, ...) is built from those flags. Display
+# levels are plain strings ("success", "info", "warning", "error").
+
+import time
+
+from config.roles import role_descriptions, role_difficulty
+from models.predictor import predict_placement
+from models.role_fit import best_fit_roles
+from nlp.resume_quality import calculate_resume_quality
+from nlp.role_index import get_role_entry
+from nlp.skill_extractor import extract_keywords, extract_skills, find_skills
+from nlp.tokenizer import tokenize
+from utils import metrics
+from utils.analysis_cache import analysis_cache, analysis_key
+from utils.validation import validate_resume_text
+
+ROADMAP_LIBRARY = {
+    "python": "Complete Python OOP and build 2 mini projects.",
+    "sql": "Practice SQL joins and queries.",
+    "machine learning": "Build one ML project.",
+    "data analysis": "Learn Pandas + visualization.",
+    "git": "Learn Git branching and maintain repo.",
+    "communication": "Practice mock interviews.",
+    "data structures": "Solve 100+ DSA problems."
+}
+
+COMPANY_TARGETS = {
+    "Amazon SDE": 1.2,
+    "Google SWE": 1.25,
+    "Infosys Graduate Engineer": 0.9,
+    "Startup Intern": 0.8
+}
+
+STAGES = [
+    ("Skill extraction", " Extracting resume skills..."),
+    ("Keyword / ATS matching", " Matching with job description..."),
+    ("Resume quality", " Checking resume quality..."),
+    ("Prediction", " Running placement prediction model..."),
+    ("Roadmap", " Generating improvement roadmap..."),
+]
+
+
+# ---------- TEXT MATCHING ----------
+def job_role_entry(role, job_description):
+    # precomputed JD skills/keywords (nlp.role_index) apply only while the
+    # JD is the predefined role's own description, or no JD was given
+    if job_description.strip() and job_description != role_descriptions.get(role):
+        return None
+    return get_role_entry(role)
+
+
+def match_skills(resume_doc, job_description, role_entry=None):
+    if role_entry is not None:
+        resume_skills = find_skills(resume_doc)
+        job_skills = role_entry["skills"]
+    else:
+        resume_skills, job_skills = extract_skills(resume_doc, job_description)
+
+    match_percentage = 0
+    if len(job_skills) > 0:
+        match_percentage = round(
+            (len(set(resume_skills).intersection(job_skills)) / len(job_skills)) * 100, 2
+        )
+
+    return {
+        "resume_skills": resume_skills,
+        "job_skills": job_skills,
+        "match_percentage": match_percentage,
+        "missing_skills": list(set(job_skills) - set(resume_skills)),
+    }
+
+
+def match_keywords(resume_doc, job_description, role_entry=None):
+    if role_entry is not None:
+        jd_keywords = role_entry["keywords"]
+    else:
+        jd_keywords = extract_keywords(job_description)
+
+    resume_keywords = extract_keywords(resume_doc)
+    matched_keywords = set(jd_keywords) & set(resume_keywords)
+    missing_keywords = set(jd_keywords) - set(resume_keywords)
+
+    if len(jd_keywords) > 0:
+        ats_score = round(len(matched_keywords) / len(jd_keywords) * 100, 2)
+    else:
+        ats_score = 0
+
+    return {
+        "matched_keywords": matched_keywords,
+        "missing_keywords": missing_keywords,
+        "ats_score": ats_score,
+    }
+
+
+def match_texts(resume_text, job_description, role_entry=None):
+    # role_entry: precomputed JD skills/keywords (nlp.role_index) for a
+    # predefined role; the resume is tokenized once and shared
+    resume_doc = tokenize(resume_text)
+
+    return dict(
+        resume_doc=resume_doc,
+        **match_skills(resume_doc, job_description, role_entry),
+        **match_keywords(resume_doc, job_description, role_entry),
+    )
+
+
+# ---------- DERIVED SIGNALS ----------
+def profile_signals(cgpa, internship, communication, dsa_score, hackathons,
+                    match_percentage, resume_quality, skill_count):
+    return {
+        "strong_cgpa": cgpa >= 8,
+        "low_cgpa": cgpa < 6.5,
+        "below_par_cgpa": cgpa < 7,
+        "academics_to_improve": cgpa < 7.5,
+        "has_internship": internship == 1,
+        "no_internship": internship == 0,
+        "good_match": match_percentage >= 70,
+        "partial_match": 40 <= match_percentage < 70,
+        "low_match": match_percentage < 40,
+        "misaligned": match_percentage < 50,
+        "skills_to_add": match_percentage < 60,
+        "good_communication": communication >= 7,
+        "weak_communication": communication <= 4,
+        "strong_dsa": dsa_score >= 7,
+        "weak_dsa": dsa_score <= 3,
+        "dsa_to_improve": dsa_score <= 5,
+        "active_hackathons": hackathons >= 2,
+        "strong_resume": resume_quality >= 7,
+        "unquantified_resume": resume_quality < 6,
+        "broad_skills": skill_count >= 4,
+        "few_skills": skill_count <= 2,
+    }
+
+
+def score_factors(sig, cgpa, match_percentage):
+    factors = []
+
+    if sig["strong_cgpa"]:
+        factors.append(f"Strong CGPA (+{round(cgpa*1.5,1)}%)")
+    elif sig["low_cgpa"]:
+        factors.append("Low CGPA (-8%)")
+
+    if sig["has_internship"]:
+        factors.append("Internship experience (+10%)")
+    else:
+        factors.append("No internship (-10%)")
+
+    if sig["good_match"]:
+        factors.append(f"Good skill match (+{round(match_percentage/5,1)}%)")
+    elif sig["low_match"]:
+        factors.append("Low skill match (-10%)")
+
+    if sig["good_communication"]:
+        factors.append("Good communication (+6%)")
+    elif sig["weak_communication"]:
+        factors.append("Weak communication (-6%)")
+
+    if sig["strong_dsa"]:
+        factors.append("Strong DSA skills (+8%)")
+    elif sig["weak_dsa"]:
+        factors.append("Weak DSA skills (-8%)")
+
+    if sig["active_hackathons"]:
+        factors.append("Certifications/Hackathons (+5%)")
+
+    return factors
+
+
+def score_reasons(sig):
+    reasons = []
+
+    if sig["strong_cgpa"]:
+        reasons.append("Strong academic performance boosted your score.")
+    elif sig["low_cgpa"]:
+        reasons.append("Low CGPA reduced your placement chances.")
+
+    if sig["has_internship"]:
+        reasons.append("Internship experience increased industry readiness.")
+    else:
+        reasons.append("No internship experience lowered real-world exposure.")
+
+    if sig["good_match"]:
+        reasons.append("Your skills match the job requirements well.")
+    elif sig["low_match"]:
+        reasons.append("Low skill match with job description reduced score.")
+
+    if sig["strong_dsa"]:
+        reasons.append("Strong DSA/problem solving is a big advantage.")
+
+    if sig["active_hackathons"]:
+        reasons.append("Hackathons/certifications improved profile strength.")
+
+    if sig["strong_resume"]:
+        reasons.append("Well-structured resume improved recruiter impression.")
+
+    return reasons
+
+
+def explain_profile(sig):
+    strengths = []
+    improvements = []
+
+    if sig["strong_cgpa"]:
+        strengths.append("Strong CGPA")
+    else:
+        improvements.append("Improve academic performance")
+
+    if sig["has_internship"]:
+        strengths.append("Internship experience")
+    else:
+        improvements.append("Get internship experience")
+
+    if sig["good_match"]:
+        strengths.append("Good skill match with job role")
+    elif sig["partial_match"]:
+        improvements.append("Improve skill match with job role")
+    else:
+        improvements.append("Major skill gaps for target role")
+
+    if sig["strong_dsa"]:
+        strengths.append("Good Dsa / Coding ability")
+    else:
+        improvements.append("Practice Dsa problems")
+
+    if sig["active_hackathons"]:
+        strengths.append("Active in hackathons / certifications")
+    else:
+        improvements.append("Do certifications or hackathons")
+
+    if sig["strong_resume"]:
+        strengths.append("Strong resume quality")
+    else:
+        improvements.append("Improve resume structure and achievements")
+
+    return strengths, improvements
+
+
+def placement_insights(sig):
+    strengths = []
+
+    if sig["strong_cgpa"]:
+        strengths.append("Strong academic performance")
+    if sig["has_internship"]:
+        strengths.append("Internship experience adds real-world exposure")
+    if sig["broad_skills"]:
+        strengths.append("Good skill coverage for the role")
+    if sig["strong_dsa"]:
+        strengths.append("Strong problem-solving ability")
+    if sig["active_hackathons"]:
+        strengths.append("Active in hackathons / certifications")
+
+    if not strengths:
+        strengths.append("Keep Hustling Hard !!")
+
+    weak = []
+
+    if sig["below_par_cgpa"]:
+        weak.append("Low CGPA may affect shortlist chances")
+    if sig["no_internship"]:
+        weak.append("No internship experience")
+    if sig["few_skills"]:
+        weak.append("Limited technical skills detected")
+    if sig["misaligned"]:
+        weak.append("Resume not aligned with job role")
+    if sig["dsa_to_improve"]:
+        weak.append("Improve coding/problem-solving skills")
+
+    if not weak:
+        weak.append("No major weak areas — keep growing 🔥")
+
+    return strengths, weak
+
+
+def next_steps(sig):
+    steps = []
+
+    if sig["skills_to_add"]:
+        steps.append("Add missing skills from job description")
+    if sig["no_internship"]:
+        steps.append("Try 1–2 internships or open-source projects")
+    if not sig["strong_dsa"]:
+        steps.append("Solve 150+ DSA problems on LeetCode")
+    if sig["unquantified_resume"]:
+        steps.append("Add quantified achievements (numbers, impact)")
+    if not sig["active_hackathons"]:
+        steps.append("Participate in hackathons or certifications")
+    if sig["academics_to_improve"]:
+        steps.append("Focus on academics next semester")
+
+    steps.append("Do mock interviews weekly")
+    steps.append("Build 1 real-world project")
+
+    return steps
+
+
+def company_readiness(probability, targets=COMPANY_TARGETS):
+    readiness = []
+
+    for company, difficulty in targets.items():
+        company_score = probability / difficulty
+        company_score = round(max(5, min(company_score, 95)), 1)
+
+        if company_score >= 85:
+            level, label = "success", "Ready"
+        elif company_score >= 65:
+            level, label = "info", "Almost Ready"
+        else:
+            level, label = "warning", "Needs Improvement"
+
+        readiness.append({
+            "company": company,
+            "score": company_score,
+            "level": level,
+            "label": label,
+        })
+
+    return readiness
+
+
+def _levels(probability, resume_quality, skill_count):
+    if skill_count == 0:
+        skill_note = ("warning", "No recognizable technical skills found.")
+    elif skill_count <= 2:
+        skill_note = ("info", "Few skills detected. Consider adding more skills.")
+    else:
+        skill_note = None
+
+    if resume_quality < 4:
+        resume_strength = ("warning", "Resume needs major improvement.")
+    elif resume_quality < 7:
+        resume_strength = ("info", "Resume is decent but can be improved.")
+    else:
+        resume_strength = ("success", "Strong resume structure.")
+
+    if probability >= 80:
+        readiness = ("success", "High Placement Readiness")
+    elif probability >= 50:
+        readiness = ("warning", "Moderate Placement Readiness")
+    else:
+        readiness = ("error", "Low Placement Readiness - Improvement Required")
+
+    if probability >= 85:
+        recommendation = ("success", "Ready to apply to top product companies.")
+    elif probability >= 65:
+        recommendation = ("info", "Ready for mid-tier companies. Improve 1-2 skills for top companies.")
+    else:
+        recommendation = ("warning", "Focus on internships, DSA, and skill matching before applying.")
+
+    return skill_note, resume_strength, readiness, recommendation
+
+
+# ---------- FULL ANALYSIS ----------
+def analyze_profile(model, cgpa, internship, projects, communication, dsa_score,
+                    hackathons, role, resume_text, job_description,
+                    model_version=None, on_stage=None, top_k=5):
+    # model_version: enables the analysis cache (e.g. file_version of the
+    # model file). on_stage(message, percent_done) is called before each stage.
+
+    if not resume_text.strip():
+        return False, "Please paste resume text."
+
+    # predefined roles reuse the JD skills/keywords extracted at import
+    role_entry = job_role_entry(role, job_description)
+
+    if role_entry is None and not job_description.strip():
+        return False, "Please provide job description."
+
+    key = None
+    if model_version is not None:
+        key = analysis_key(
+            cgpa, internship, projects, communication, dsa_score, hackathons,
+            role, resume_text, job_description, model_version
+        )
+        cached = analysis_cache.get(key)
+        metrics.count("analysis_cache", result="miss" if cached is None else "hit")
+        if cached is not None:
+            return True, dict(cached, cached=True)
+
+    stage_times = {}
+
+    def stage(i):
+        name, message = STAGES[i]
+        if on_stage is not None:
+            on_stage(message, i * 100 // len(STAGES))
+        return name, time.perf_counter()
+
+    # ---------- STAGE 1: SKILLS ----------
+    name, t0 = stage(0)
+    resume_doc = tokenize(resume_text)
+    text = match_skills(resume_doc, job_description, role_entry)
+    stage_times[name] = time.perf_counter() - t0
+
+    # ---------- STAGE 2: KEYWORDS / ATS ----------
+    name, t0 = stage(1)
+    text.update(match_keywords(resume_doc, job_description, role_entry))
+    stage_times[name] = time.perf_counter() - t0
+
+    # ---------- STAGE 3: RESUME QUALITY + VALIDATION ----------
+    name, t0 = stage(2)
+    resume_quality = calculate_resume_quality(resume_doc, text["resume_skills"])
+
+    ok, msg = validate_resume_text(resume_doc)
+    if not ok:
+        return False, msg
+
+    stage_times[name] = time.perf_counter() - t0
+
+    # ---------- STAGE 4: MODEL ----------
+    name, t0 = stage(3)
+    ok, probability = predict_placement(
+        model,
+        cgpa,
+        internship,
+        communication,
+        text["match_percentage"],
+        projects,
+        dsa_score,
+        resume_quality,
+        hackathons,
+        role,
+        role_difficulty
+    )
+
+    if not ok:
+        return False, f"Prediction failed. Please check inputs. ({probability})"
+
+    ok, ranked_roles = best_fit_roles(
+        model, resume_doc, cgpa, internship, projects, communication,
+        dsa_score, hackathons, top_k=top_k
+    )
+    if not ok:
+        ranked_roles = []
+
+    stage_times[name] = time.perf_counter() - t0
+
+    # ---------- STAGE 5: ROADMAP + EXPLANATIONS ----------
+    name, t0 = stage(4)
+    missing_skills = text["missing_skills"]
+    roadmap = [
+        ROADMAP_LIBRARY[skill] for skill in missing_skills
+        if skill in ROADMAP_LIBRARY
+    ]
+
+    skill_count = len(text["resume_skills"])
+    match_percentage = text["match_percentage"]
+    sig = profile_signals(
+        cgpa, internship, communication, dsa_score, hackathons,
+        match_percentage, resume_quality, skill_count
+    )
+    strengths, improvements = explain_profile(sig)
+    insight_strengths, weak_areas = placement_insights(sig)
+    skill_note, resume_strength, readiness, recommendation = _levels(
+        probability, resume_quality, skill_count
+    )
+    stage_times[name] = time.perf_counter() - t0
+
+    result = dict(
+        text,
+        resume_quality=resume_quality,
+        probability=probability,
+        ranked_roles=ranked_roles,
+        roadmap=roadmap,
+        signals=sig,
+        score_factors=score_factors(sig, cgpa, match_percentage),
+        score_reasons=score_reasons(sig),
+        strengths=strengths,
+        improvements=improvements,
+        insight_strengths=insight_strengths,
+        weak_areas=weak_areas,
+        next_steps=next_steps(sig),
+        company_readiness=company_readiness(probability),
+        skill_note=skill_note,
+        resume_strength=resume_strength,
+        readiness=readiness,
+        recommendation=recommendation,
+        skill_profile={
+            "CGPA": cgpa*10,
+            "Projects": projects*20,
+            "Skill Match": match_percentage,
+            "Communication": communication*10,
+        },
+        stage_times=stage_times,
+        cached=False,
+    )
+
+    if key is not None:
+        analysis_cache.put(key, result)
+
+    return True, result
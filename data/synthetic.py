@@ -0,0 +1,357 @@
+# Seeded synthetic data for load and scale testing, written chunk by chunk
+# to CSV or Parquet so millions of rows never sit in memory at once.
+#
+#   python -m data.synthetic profiles -n 1000000 -o students.csv
+#   python -m data.synthetic jobs -n 50000 -o jobs.parquet
+#   python -m data.synthetic campus -n 1000000 -o campus_big.csv
+#
+#   profiles  score.py input: cgpa, internship, projects, communication,
+#             dsa_score, hackathons, role, resume_text, job_description
+#   jobs      job_id, role, job_description (DriveMatcher / matching load)
+#   campus    data/campus.csv columns, for train_model.py --incremental
+#
+# Rows are generated in fixed blocks of BLOCK_ROWS, each from its own
+# RandomState([seed, block]), so the same --seed gives the same rows whatever
+# the --chunksize. Random draws are vectorized per block; only the final
+# string assembly runs per row.
+#
+# A latent "strength" per student drives cgpa, scores, project/skill counts
+# and how many of the resume's skills come from the target role, so match
+# percentages and placement probabilities spread out the way real ones do.
+
+import argparse
+import os
+import sys
+import time
+
+import numpy as np
+import pandas as pd
+
+from config.roles import role_descriptions
+from nlp.role_index import ROLE_INDEX
+from nlp.skill_extractor import SKILLS
+
+BLOCK_ROWS = 10_000
+
+MAX_SKILLS = 24
+MAX_PROJECTS = 6
+
+ROLES = [r for r in role_descriptions if r in ROLE_INDEX and ROLE_INDEX[r]["skills"]]
+
+DEGREES = ["B.Tech Computer Science", "B.Tech Information Technology",
+           "B.E. Electronics", "B.Sc Computer Science", "B.Tech Mechanical",
+           "BCA", "M.Tech Computer Science", "MCA"]
+THINGS = ["a dashboard", "a web application", "a REST API", "a recommendation engine",
+          "a chatbot", "a data pipeline", "a mobile app", "a prediction model",
+          "an inventory system", "a monitoring tool", "a search service", "a portfolio site"]
+METRICS = ["accuracy", "latency", "load time", "throughput", "conversion",
+           "test coverage", "query time", "user retention"]
+COMPANIES = ["a fintech startup", "an e-commerce company", "a healthcare startup",
+             "a consulting firm", "a product company", "a research lab"]
+DUTIES = ["build and ship features", "write clean, tested code",
+          "work with cross-functional teams", "analyze data and present insights",
+          "debug production issues", "design scalable systems",
+          "document their work", "review code and mentor juniors"]
+
+
+# ---------- VOCABULARY ----------
+def build_vocabulary(skills=SKILLS):
+    names = list(skills)
+    aliases, offsets, counts = [], [], []
+
+    for name in names:
+        offsets.append(len(aliases))
+        counts.append(len(skills[name]))
+        aliases += skills[name]
+
+    position = {name: i for i, name in enumerate(names)}
+    role_skills = [np.array([position[s] for s in ROLE_INDEX[r]["skills"]]) for r in ROLES]
+    width = max(len(s) for s in role_skills)
+
+    return {
+        "aliases": np.array(aliases, dtype=object),
+        "offsets": np.array(offsets),
+        "counts": np.array(counts),
+        # role x slot matrix of skill ids, plus how many slots each role uses
+        "role_skills": np.array([np.resize(s, width) for s in role_skills]),
+        "role_counts": np.array([len(s) for s in role_skills]),
+    }
+
+
+def _pick_aliases(vocab, skill_ids, rng):
+    # one random alias per skill id, same shape as skill_ids
+    u = rng.uniform(size=skill_ids.shape)
+    picks = vocab["offsets"][skill_ids] + (u * vocab["counts"][skill_ids]).astype(int)
+    return vocab["aliases"][picks]
+
+
+def _role_skill_ids(vocab, role_ids, width, rng):
+    u = rng.uniform(size=(len(role_ids), width))
+    slots = (u * vocab["role_counts"][role_ids][:, None]).astype(int)
+    return vocab["role_skills"][role_ids[:, None], slots]
+
+
+def _sigmoid(x):
+    return 1 / (1 + np.exp(-x))
+
+
+# ---------- JOB DESCRIPTIONS ----------
+def _job_texts(vocab, role_ids, rng):
+    n = len(role_ids)
+
+    # mostly the role's own skills, plus the odd extra from the vocabulary
+    skill_ids = _role_skill_ids(vocab, role_ids, 6, rng)
+    extra = rng.randint(0, len(vocab["counts"]), size=(n, 2))
+    skill_ids = np.concatenate([skill_ids, extra], axis=1)
+    aliases = _pick_aliases(vocab, skill_ids, rng)
+
+    n_skills = np.clip(vocab["role_counts"][role_ids] + rng.randint(-1, 2, n), 2, 6)
+    n_extra = rng.randint(0, 3, n)
+    first_duty = rng.randint(0, len(DUTIES), n)
+    second_duty = (first_duty + rng.randint(1, len(DUTIES), n)) % len(DUTIES)
+    roles = np.array(ROLES, dtype=object)[role_ids]
+
+    texts = []
+    for i in range(n):
+        skills = list(dict.fromkeys(aliases[i, :n_skills[i]]))
+        extras = [a for a in aliases[i, 6:6 + n_extra[i]] if a not in skills]
+        listed = skills[0] if len(skills) == 1 else f"{', '.join(skills[:-1])} and {skills[-1]}"
+        text = f"{roles[i]} with {listed}."
+        if extras:
+            text += f" Knowledge of {' and '.join(extras)} is a plus."
+        text += f" Candidate must {DUTIES[first_duty[i]]} and {DUTIES[second_duty[i]]}."
+        texts.append(text)
+
+    return texts
+
+
+def generate_jobs(n, rng, vocab, start=0):
+    role_ids = rng.randint(0, len(ROLES), n)
+    return pd.DataFrame({
+        "job_id": np.arange(start, start + n),
+        "role": np.array(ROLES, dtype=object)[role_ids],
+        "job_description": _job_texts(vocab, role_ids, rng),
+    })
+
+
+# ---------- PROFILES ----------
+def generate_profiles(n, rng, vocab, start=0, job_descriptions=True):
+    strength = rng.normal(size=n)
+
+    cgpa = np.clip(7.3 + 0.9 * strength + rng.normal(0, 0.4, n), 5.0, 10.0).round(2)
+    internship = (rng.uniform(size=n) < _sigmoid(-0.3 + 0.9 * strength)).astype(int)
+    projects = np.clip(rng.poisson(np.exp(0.7 + 0.35 * strength)), 0, MAX_PROJECTS)
+    communication = np.clip(np.rint(6 + 1.2 * strength + rng.normal(0, 1.5, n)), 1, 10).astype(int)
+    dsa_score = np.clip(np.rint(5.5 + 1.6 * strength + rng.normal(0, 1.5, n)), 1, 10).astype(int)
+    hackathons = np.clip(rng.poisson(np.exp(-0.2 + 0.5 * strength)), 0, 8)
+    role_ids = rng.randint(0, len(ROLES), n)
+
+    # resume skills: a mix of the target role's skills and random ones
+    n_skills = np.clip(rng.poisson(np.exp(1.6 + 0.35 * strength)), 1, MAX_SKILLS)
+    on_role = np.clip(0.55 + 0.2 * strength + rng.normal(0, 0.15, n), 0, 1)
+    role_ids_skills = _role_skill_ids(vocab, role_ids, MAX_SKILLS, rng)
+    random_skills = rng.randint(0, len(vocab["counts"]), size=(n, MAX_SKILLS))
+    from_role = rng.uniform(size=(n, MAX_SKILLS)) < on_role[:, None]
+    aliases = _pick_aliases(vocab, np.where(from_role, role_ids_skills, random_skills), rng)
+
+    degree = rng.randint(0, len(DEGREES), n)
+    things = rng.randint(0, len(THINGS), size=(n, MAX_PROJECTS))
+    metrics = rng.randint(0, len(METRICS), size=(n, MAX_PROJECTS))
+    gains = rng.randint(5, 60, size=(n, MAX_PROJECTS))
+    company = rng.randint(0, len(COMPANIES), n)
+    months = rng.randint(2, 7, n)
+    year = rng.randint(2021, 2027, n)
+
+    resumes = []
+    for i in range(n):
+        skills = list(dict.fromkeys(aliases[i, :n_skills[i]]))
+        lines = [
+            f"Student {start + i}",
+            f"{DEGREES[degree[i]]}, graduating {year[i]}, CGPA {cgpa[i]:.2f}",
+            f"Skills: {', '.join(skills)}",
+        ]
+        for p in range(projects[i]):
+            tools = " and ".join(skills[p % len(skills):p % len(skills) + 2])
+            lines.append(
+                f"Project: built {THINGS[things[i, p]]} using {tools}, "
+                f"improving {METRICS[metrics[i, p]]} by {gains[i, p]}%"
+            )
+        if internship[i]:
+            lines.append(
+                f"Internship: {months[i]} months at {COMPANIES[company[i]]} "
+                f"working with {skills[0]}"
+            )
+        if hackathons[i]:
+            lines.append(f"Participated in {hackathons[i]} hackathons")
+        resumes.append("\n".join(lines))
+
+    df = pd.DataFrame({
+        "student_id": np.arange(start, start + n),
+        "cgpa": cgpa,
+        "internship": internship,
+        "projects": projects,
+        "communication": communication,
+        "dsa_score": dsa_score,
+        "hackathons": hackathons,
+        "role": np.array(ROLES, dtype=object)[role_ids],
+        "resume_text": resumes,
+    })
+
+    if job_descriptions:
+        df["job_description"] = _job_texts(vocab, role_ids, rng)
+
+    return df
+
+
+# ---------- CAMPUS ROWS ----------
+# marginals roughly follow data/campus.csv; placement depends on academics
+# and work experience like it does there (~69% placed)
+def generate_campus(n, rng, vocab=None, start=0):
+    strength = rng.normal(size=n)
+
+    def percent(mean, spread, low, high, weight):
+        noise = rng.normal(size=n)
+        value = mean + spread * (weight * strength + np.sqrt(1 - weight ** 2) * noise)
+        return np.clip(value, low, high).round(2)
+
+    def pick(values, probs):
+        return np.array(values, dtype=object)[rng.choice(len(values), size=n, p=probs)]
+
+    workex = rng.uniform(size=n) < 0.34
+    ssc_p = percent(67.3, 10.8, 40, 90, 0.7)
+    hsc_p = percent(66.3, 10.9, 37, 98, 0.6)
+    degree_p = percent(66.4, 7.4, 50, 91, 0.6)
+    etest_p = percent(72.1, 13.3, 50, 98, 0.2)
+    mba_p = percent(62.3, 5.8, 51, 78, 0.2)
+
+    placed = rng.uniform(size=n) < _sigmoid(1.0 + 1.6 * strength + 1.2 * workex)
+    offer = np.maximum(np.rint(rng.lognormal(12.5, 0.25, n) / 1000) * 1000, 200_000)
+    salary = np.where(placed, offer, np.nan)
+
+    return pd.DataFrame({
+        "sl_no": np.arange(start + 1, start + n + 1),
+        "gender": pick(["M", "F"], [0.65, 0.35]),
+        "ssc_p": ssc_p,
+        "ssc_b": pick(["Central", "Others"], [0.54, 0.46]),
+        "hsc_p": hsc_p,
+        "hsc_b": pick(["Others", "Central"], [0.61, 0.39]),
+        "hsc_s": pick(["Commerce", "Science", "Arts"], [0.53, 0.42, 0.05]),
+        "degree_p": degree_p,
+        "degree_t": pick(["Comm&Mgmt", "Sci&Tech", "Others"], [0.67, 0.27, 0.06]),
+        "workex": np.where(workex, "Yes", "No"),
+        "etest_p": etest_p,
+        "specialisation": pick(["Mkt&Fin", "Mkt&HR"], [0.56, 0.44]),
+        "mba_p": mba_p,
+        "status": np.where(placed, "Placed", "Not Placed"),
+        "salary": salary,
+    })
+
+
+GENERATORS = {
+    "profiles": generate_profiles,
+    "jobs": generate_jobs,
+    "campus": generate_campus,
+}
+
+
+# ---------- CHUNKED OUTPUT ----------
+def iter_blocks(kind, rows, seed=0, **options):
+    generate = GENERATORS[kind]
+    vocab = None if kind == "campus" else build_vocabulary()
+
+    for block, start in enumerate(range(0, rows, BLOCK_ROWS)):
+        rng = np.random.RandomState([seed, block])
+        yield generate(min(BLOCK_ROWS, rows - start), rng, vocab, start=start, **options)
+
+
+def iter_chunks(kind, rows, chunksize=100_000, seed=0, **options):
+    pending = []
+    pending_rows = 0
+
+    for df in iter_blocks(kind, rows, seed, **options):
+        pending.append(df)
+        pending_rows += len(df)
+        if pending_rows >= chunksize:
+            yield pd.concat(pending, ignore_index=True)
+            pending, pending_rows = [], 0
+
+    if pending:
+        yield pd.concat(pending, ignore_index=True)
+
+
+class ChunkWriter:
+
+    def __init__(self, path, fmt=None):
+        self.path = path
+        self.fmt = fmt or ("parquet" if path.endswith((".parquet", ".pq")) else "csv")
+        self._parquet = None
+        self._first = True
+
+        if self.fmt == "parquet":
+            try:
+                import pyarrow  # noqa: F401
+            except ImportError:
+                raise RuntimeError("Parquet output needs pyarrow (pip install pyarrow).")
+
+    def write(self, df):
+        if self.fmt == "csv":
+            df.to_csv(self.path, mode="w" if self._first else "a", header=self._first, index=False)
+        else:
+            import pyarrow as pa
+            import pyarrow.parquet as pq
+
+            table = pa.Table.from_pandas(df, preserve_index=False)
+            if self._parquet is None:
+                self._parquet = pq.ParquetWriter(self.path, table.schema)
+            self._parquet.write_table(table)
+
+        self._first = False
+
+    def close(self):
+        if self._parquet is not None:
+            self._parquet.close()
+
+
+def write_synthetic(kind, rows, path, chunksize=100_000, seed=0, fmt=None, **options):
+    writer = ChunkWriter(path, fmt)
+    total = 0
+    start = time.perf_counter()
+
+    try:
+        for chunk in iter_chunks(kind, rows, chunksize, seed, **options):
+            writer.write(chunk)
+            total += len(chunk)
+            elapsed = time.perf_counter() - start
+            print(f"{total} rows  {total / elapsed:,.0f} rows/sec", file=sys.stderr)
+    finally:
+        writer.close()
+
+    return total
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Generate synthetic PlacementIQ data.")
+    parser.add_argument("kind", choices=sorted(GENERATORS))
+    parser.add_argument("-n", "--rows", type=int, default=100_000)
+    parser.add_argument("-o", "--output", required=True, help=".csv or .parquet path")
+    parser.add_argument("--format", choices=["csv", "parquet"],
+                        help="default: from the output extension")
+    parser.add_argument("--chunksize", type=int, default=100_000, help="rows per write")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--no-jd", action="store_true",
+                        help="profiles: leave out job_description (score.py then "
+                             "uses the predefined description for the role)")
+    args = parser.parse_args(argv)
+
+    options = {"job_descriptions": not args.no_jd} if args.kind == "profiles" else {}
+
+    start = time.perf_counter()
+    total = write_synthetic(args.kind, args.rows, args.output, args.chunksize,
+                            args.seed, args.format, **options)
+    size = os.path.getsize(args.output) / 1e6
+    print(f"Wrote {total} {args.kind} rows ({size:,.1f} MB) in "
+          f"{time.perf_counter() - start:.1f}s -> {args.output}", file=sys.stderr)
+
+
+if __name__ == "__main__":
+    main()
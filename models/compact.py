@@ -0,0 +1,275 @@
+# Compact, sklearn-free form of the trained placement model.
+#
+# export_compact() flattens the chosen pipeline into plain arrays in an .npz
+# file; load_compact() returns a CompactModel whose predict_proba() gives the
+# same numbers as the sklearn model, using only NumPy. That lets the app score
+# a profile in microseconds without importing sklearn or unpickling anything.
+#
+#   export_compact(joblib.load("models/placement_model.pkl"),
+#                  "models/placement_model.npz", source="models/placement_model.pkl")
+#   model = load_compact("models/placement_model.npz")
+#   model.predict_proba(X)
+#
+# Kinds:
+#   logistic  optional StandardScaler + LogisticRegression / SGDClassifier(log_loss)
+#   forest    RandomForestClassifier (mean of per-tree leaf probabilities)
+#   gboost    binary GradientBoostingClassifier (init + lr * sum of leaf values)
+
+import hashlib
+import math
+import sys
+
+import numpy as np
+
+FORMAT_VERSION = 1
+
+
+def compact_path(model_path):
+    base = model_path[:-4] if model_path.endswith(".pkl") else model_path
+    return base + ".npz"
+
+
+def file_digest(path):
+    with open(path, "rb") as f:
+        return hashlib.sha256(f.read()).hexdigest()
+
+
+def _expit(z):
+    # sklearn goes through scipy.special.expit, which is 1 / (1 + exp(-z))
+    # on the C library exp. np.exp can differ from it in the last bit, so
+    # evaluate exp with math.exp to reproduce predict_proba exactly.
+    z = np.asarray(z, dtype=np.float64)
+    e = np.fromiter(map(math.exp, (-z).ravel().tolist()), dtype=np.float64, count=z.size)
+    return 1.0 / (1.0 + e.reshape(z.shape))
+
+
+# ---------- EXPORT ----------
+def _split_pipeline(model):
+    steps = getattr(model, "steps", None)
+    if steps is None:
+        return None, model
+
+    if len(steps) == 1:
+        return None, steps[0][1]
+    if len(steps) == 2:
+        return steps[0][1], steps[1][1]
+
+    raise ValueError("only a scaler + model pipeline can be exported")
+
+
+def _binary_classes(model):
+    classes = np.asarray(model.classes_)
+    if len(classes) != 2:
+        raise ValueError("only binary classifiers can be exported")
+    return classes
+
+
+def _export_logistic(scaler, model):
+    if getattr(model, "loss", "log_loss") != "log_loss":
+        raise ValueError(f"SGDClassifier with loss={model.loss!r} has no predict_proba")
+
+    arrays = {
+        "coef": np.asarray(model.coef_, dtype=np.float64).ravel(),
+        "intercept": np.asarray(model.intercept_, dtype=np.float64).ravel(),
+    }
+
+    if scaler is not None:
+        if type(scaler).__name__ != "StandardScaler":
+            raise ValueError(f"cannot export scaler {type(scaler).__name__}")
+        n = len(arrays["coef"])
+        arrays["mean"] = (np.asarray(scaler.mean_, dtype=np.float64)
+                          if scaler.with_mean else np.zeros(n))
+        arrays["scale"] = (np.asarray(scaler.scale_, dtype=np.float64)
+                           if scaler.with_std else np.ones(n))
+
+    return "logistic", arrays
+
+
+def _flatten_trees(trees, leaf_value):
+    # one global node table; children are stored as global indices
+    left, right, feature, threshold, value, roots = [], [], [], [], [], []
+    offset = 0
+    max_depth = 0
+
+    for tree in trees:
+        t = tree.tree_
+        leaf = t.children_left < 0
+        left.append(np.where(leaf, -1, t.children_left + offset))
+        right.append(np.where(leaf, -1, t.children_right + offset))
+        feature.append(np.where(leaf, 0, t.feature))
+        threshold.append(t.threshold)
+        value.append(leaf_value(t))
+        roots.append(offset)
+        offset += t.node_count
+        max_depth = max(max_depth, t.max_depth)
+
+    return {
+        "left": np.concatenate(left).astype(np.int64),
+        "right": np.concatenate(right).astype(np.int64),
+        "feature": np.concatenate(feature).astype(np.int64),
+        "threshold": np.concatenate(threshold).astype(np.float64),
+        "value": np.concatenate(value).astype(np.float64),
+        "roots": np.array(roots, dtype=np.int64),
+        "max_depth": np.array(max_depth),
+    }
+
+
+def _export_forest(model):
+    # tree_.value already holds the class fractions of each leaf
+    arrays = _flatten_trees(model.estimators_, lambda t: t.value[:, 0, :2])
+    return "forest", arrays
+
+
+def _export_gboost(model):
+    if model.estimators_.shape[1] != 1:
+        raise ValueError("only binary gradient boosting can be exported")
+
+    # the init estimator ignores X (class prior or zero), so its raw score
+    # is one constant
+    init = model._raw_predict_init(np.zeros((1, model.n_features_in_)))[0, 0]
+
+    arrays = _flatten_trees(model.estimators_[:, 0], lambda t: t.value[:, 0, 0])
+    arrays["init"] = np.array(init, dtype=np.float64)
+    arrays["learning_rate"] = np.array(model.learning_rate, dtype=np.float64)
+    return "gboost", arrays
+
+
+def export_compact(model, path, source=None):
+    scaler, estimator = _split_pipeline(model)
+    classes = _binary_classes(estimator)
+    name = type(estimator).__name__
+
+    if name in ("LogisticRegression", "SGDClassifier"):
+        kind, arrays = _export_logistic(scaler, estimator)
+    elif scaler is not None:
+        raise ValueError(f"cannot export a scaled {name}")
+    elif name == "RandomForestClassifier":
+        kind, arrays = _export_forest(estimator)
+    elif name == "GradientBoostingClassifier":
+        kind, arrays = _export_gboost(estimator)
+    else:
+        raise ValueError(f"cannot export {name}")
+
+    meta = {
+        "format": np.array(FORMAT_VERSION),
+        "kind": np.array(kind),
+        "classes": classes,
+        "n_features": np.array(estimator.n_features_in_),
+        # sha256 of the pickle this was exported from, so a stale export
+        # can be detected after retraining
+        "source": np.array(file_digest(source) if source else ""),
+    }
+
+    with open(path, "wb") as f:
+        np.savez(f, **meta, **arrays)
+
+    return kind
+
+
+# ---------- EVALUATION ----------
+class CompactModel:
+
+    def __init__(self, kind, arrays, classes, n_features, source=""):
+        self.kind = kind
+        self.classes_ = classes
+        self.n_features_in_ = n_features
+        self.source = source
+        self._a = arrays
+
+        if kind in ("forest", "gboost"):
+            self._max_depth = int(arrays["max_depth"])
+        elif kind != "logistic":
+            raise ValueError(f"unknown compact model kind {kind!r}")
+
+    def _check(self, X):
+        X = np.asarray(X)
+        if X.ndim != 2 or X.shape[1] != self.n_features_in_:
+            raise ValueError(
+                f"expected shape (n, {self.n_features_in_}), got {X.shape}"
+            )
+        return X
+
+    # ---------- logistic ----------
+    def _logistic(self, X):
+        a = self._a
+        X = np.array(X, dtype=np.float64)
+
+        if "mean" in a:
+            X -= a["mean"]
+            X /= a["scale"]
+
+        return _expit(X @ a["coef"][:, None] + a["intercept"])[:, 0]
+
+    # ---------- trees ----------
+    def _leaves(self, X):
+        # walk every tree for every row at once, one level per step; the
+        # split test matches sklearn: float32 feature <= float64 threshold
+        a = self._a
+        X = np.asarray(X, dtype=np.float32)
+        rows = np.arange(len(X))[:, None]
+        node = np.repeat(a["roots"][None, :], len(X), axis=0)
+
+        for _ in range(self._max_depth):
+            left = a["left"][node]
+            inner = left >= 0
+            if not inner.any():
+                break
+            go_left = X[rows, a["feature"][node]] <= a["threshold"][node]
+            node = np.where(inner, np.where(go_left, left, a["right"][node]), node)
+
+        return node
+
+    def _forest(self, X):
+        values = self._a["value"][self._leaves(X)]
+
+        # accumulate both class columns tree by tree, in order, like sklearn
+        total = np.zeros((len(X), 2))
+        for t in range(values.shape[1]):
+            total += values[:, t]
+        return total / values.shape[1]
+
+    def _gboost(self, X):
+        a = self._a
+        values = a["value"][self._leaves(X)]
+        lr = float(a["learning_rate"])
+
+        raw = np.full(len(X), float(a["init"]))
+        for t in range(values.shape[1]):
+            raw += lr * values[:, t]
+        return _expit(raw)
+
+    def predict_proba(self, X):
+        X = self._check(X)
+
+        if self.kind == "forest":
+            return self._forest(X)
+
+        p = self._logistic(X) if self.kind == "logistic" else self._gboost(X)
+        return np.column_stack([1 - p, p])
+
+    def predict(self, X):
+        return self.classes_[(self.predict_proba(X)[:, 1] > 0.5).astype(int)]
+
+
+def load_compact(path):
+    with np.load(path, allow_pickle=False) as data:
+        if int(data["format"]) != FORMAT_VERSION:
+            raise ValueError(f"unsupported compact model format {int(data['format'])}")
+
+        arrays = {k: data[k] for k in data.files
+                  if k not in ("format", "kind", "classes", "n_features", "source")}
+        return CompactModel(
+            str(data["kind"]), arrays, data["classes"],
+            int(data["n_features"]), str(data["source"])
+        )
+
+
+# ---------- CLI ----------
+# python -m models.compact [model.pkl [model.npz]]
+if __name__ == "__main__":
+    import joblib
+
+    src = sys.argv[1] if len(sys.argv) > 1 else "models/placement_model.pkl"
+    dst = sys.argv[2] if len(sys.argv) > 2 else compact_path(src)
+    kind = export_compact(joblib.load(src), dst, source=src)
+    print(f"Exported {kind} model to {dst}")
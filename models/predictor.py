@@ -1,6 +1,11 @@
 # models/predictor.py
 import numpy as np
 
+from nlp.vectorize import py_round
+from utils.metrics import span
+
+
+@span("predict_placement")
 def predict_placement(
     model,
     cgpa,
@@ -43,4 +48,53 @@ def predict_placement(
         return True, round(probability, 2)
 
     except Exception as e:
-        return False, str(e)
\ No newline at end of file
+        return False, str(e)
+
+@span("predict_placement_batch")
+def predict_placement_batch(model, profiles, role_difficulty):
+    # profiles: DataFrame or mapping of column name -> array-like, with
+    # the same fields predict_placement takes. "role" may be a single
+    # role name or one per row.
+    try:
+        cgpa = np.asarray(profiles["cgpa"], dtype=float)
+        internship = np.asarray(profiles["internship"])
+        communication = np.asarray(profiles["communication"])
+        match_percentage = np.asarray(profiles["match_percentage"], dtype=float)
+        projects = np.asarray(profiles["projects"])
+        dsa_score = np.asarray(profiles["dsa_score"])
+        resume_quality = np.asarray(profiles["resume_quality"])
+        hackathons = np.asarray(profiles["hackathons"])
+
+        role = profiles["role"]
+        if isinstance(role, str):
+            multiplier = role_difficulty.get(role, 1.0)
+        else:
+            multiplier = np.array([role_difficulty.get(r, 1.0) for r in role])
+
+        input_features = np.column_stack([
+            cgpa,
+            internship,
+            communication,
+            match_percentage
+        ]).astype(float)
+
+        raw_prob = model.predict_proba(input_features)[:, 1]
+
+        probability = raw_prob * 60
+        probability += projects * 1.2
+        probability += dsa_score * 0.8
+        probability += resume_quality * 0.7
+        probability += hackathons * 0.6
+
+        probability *= multiplier
+
+        probability = np.where(internship == 0, probability * 0.9, probability)
+        probability = np.where(cgpa < 6.5, probability * 0.85, probability)
+        probability = np.where(match_percentage < 40, probability * 0.8, probability)
+
+        probability = np.clip(probability, 5, 95)
+        # round() semantics, so every row equals predict_placement's result
+        return True, py_round(probability, 2)
+
+    except Exception as e:
+        return False, str(e)
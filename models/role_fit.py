@@ -0,0 +1,123 @@
+# Best-fit roles: scores one resume against every role at once.
+#
+# Each role's JD skills and ATS keywords become rows of a binary role x skill
+# matrix and a sparse role x keyword matrix. Matching a resume is then two
+# matrix-vector products plus one predict_placement_batch call, so the cost
+# barely grows with the number of roles.
+
+import numpy as np
+
+from models.predictor import predict_placement_batch
+from nlp.resume_quality import calculate_resume_quality
+from nlp.role_index import ROLE_INDEX
+from nlp.skill_extractor import SKILLS, extract_keywords, find_skills
+from nlp.tokenizer import tokenize
+from nlp.vectorize import binary_csr, build_vocabulary, percentage
+
+
+class RoleFitEngine:
+
+    def __init__(self, role_index, skills=SKILLS):
+        self.roles = list(role_index)
+        self.role_skills = [role_index[r]["skills"] for r in self.roles]
+        self.difficulty = {r: role_index[r]["difficulty"] for r in self.roles}
+
+        self.skill_pos = {s: i for i, s in enumerate(skills)}
+
+        self.keyword_pos = build_vocabulary(role_index[r]["keywords"] for r in self.roles)
+
+        self.skill_matrix = binary_csr(
+            [[self.skill_pos[s] for s in skills_] for skills_ in self.role_skills],
+            len(self.skill_pos)
+        )
+        self.keyword_matrix = binary_csr(
+            [[self.keyword_pos[k] for k in role_index[r]["keywords"]] for r in self.roles],
+            len(self.keyword_pos)
+        )
+
+        self.skill_counts = np.asarray(self.skill_matrix.sum(axis=1)).ravel()
+        self.keyword_counts = np.asarray(self.keyword_matrix.sum(axis=1)).ravel()
+
+    def _indicator(self, items, positions):
+        vec = np.zeros(len(positions))
+        idx = [positions[i] for i in items if i in positions]
+        vec[idx] = 1.0
+        return vec
+
+    def match(self, resume_text, resume_skills=None):
+        doc = tokenize(resume_text)
+        if resume_skills is None:
+            resume_skills = find_skills(doc)
+        resume_keywords = extract_keywords(doc)
+
+        skill_hits = self.skill_matrix @ self._indicator(resume_skills, self.skill_pos)
+        keyword_hits = self.keyword_matrix @ self._indicator(resume_keywords, self.keyword_pos)
+
+        match = percentage(skill_hits, self.skill_counts)
+        ats = percentage(keyword_hits, self.keyword_counts)
+
+        return resume_skills, match, ats
+
+    def rank(self, model, resume_text, cgpa, internship, projects, communication,
+             dsa_score, hackathons, top_k=5):
+        doc = tokenize(resume_text)
+        resume_skills, match, ats = self.match(doc)
+        resume_quality = calculate_resume_quality(doc, resume_skills)
+
+        n = len(self.roles)
+        ok, probability = predict_placement_batch(
+            model,
+            {
+                "cgpa": np.full(n, cgpa, dtype=float),
+                "internship": np.full(n, internship),
+                "communication": np.full(n, communication),
+                "match_percentage": match,
+                "projects": np.full(n, projects),
+                "dsa_score": np.full(n, dsa_score),
+                "resume_quality": np.full(n, resume_quality),
+                "hackathons": np.full(n, hackathons),
+                "role": self.roles,
+            },
+            self.difficulty
+        )
+
+        if not ok:
+            return False, probability
+
+        top_k = min(top_k, n)
+        # order by probability, then by skill match
+        candidates = np.argpartition(-probability, top_k - 1)[:top_k] if top_k < n else np.arange(n)
+        order = candidates[np.lexsort((-match[candidates], -probability[candidates]))]
+
+        resume_set = set(resume_skills)
+        ranked = [
+            {
+                "role": self.roles[i],
+                "probability": float(probability[i]),
+                "match_percentage": float(match[i]),
+                "ats_score": float(ats[i]),
+                "missing_skills": [s for s in self.role_skills[i] if s not in resume_set],
+            }
+            for i in order
+        ]
+        return True, ranked
+
+
+_engine = None
+
+
+def get_role_fit_engine():
+    global _engine
+
+    if _engine is None:
+        _engine = RoleFitEngine(ROLE_INDEX)
+
+    return _engine
+
+
+def best_fit_roles(model, resume_text, cgpa, internship, projects, communication,
+                   dsa_score, hackathons, top_k=5):
+    return get_role_fit_engine().rank(
+        model, resume_text, cgpa, internship, projects, communication,
+        dsa_score, hackathons, top_k
+    )
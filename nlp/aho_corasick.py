@@ -0,0 +1,121 @@
+from collections import deque
+
+
+def is_word_char(ch):
+    return ch.isalnum() or ch == "_"
+
+
+def has_word(text, keyword):
+    # keyword occurs with no letter, digit or underscore on either side
+    n = len(keyword)
+    i = text.find(keyword)
+    while i != -1:
+        before = text[i - 1] if i else " "
+        after = text[i + n] if i + n < len(text) else " "
+        if not is_word_char(before) and not is_word_char(after):
+            return True
+        i = text.find(keyword, i + 1)
+    return False
+
+
+class KeywordAutomaton:
+    # Aho-Corasick automaton: finds every keyword occurring as a substring
+    # of the text in one left-to-right pass, regardless of keyword count.
+    # Keywords listed in `whole_words` only count when the characters on
+    # either side of the hit are not letters, digits or underscores.
+
+    # below this many keywords, C-level `in` checks beat the Python scan
+    linear_scan_threshold = 32
+
+    def __init__(self, patterns, whole_words=()):
+        self.goto = [{}]
+        self.fail = [0]
+        self.out = [frozenset()]
+        self.bounded = [()]
+        self.values = set()
+        self.whole_words = frozenset(whole_words)
+        self.patterns = [(k, v) for k, v in patterns if k]
+
+        for keyword, value in self.patterns:
+            self._add(keyword, value)
+
+        self._link()
+        self.alphabet = frozenset(ch for edges in self.goto for ch in edges)
+
+    def _add(self, keyword, value):
+        state = 0
+        for ch in keyword:
+            nxt = self.goto[state].get(ch)
+            if nxt is None:
+                nxt = len(self.goto)
+                self.goto[state][ch] = nxt
+                self.goto.append({})
+                self.fail.append(0)
+                self.out.append(frozenset())
+                self.bounded.append(())
+            state = nxt
+
+        if keyword in self.whole_words:
+            # (length, value): checked against the text around each hit
+            self.bounded[state] = self.bounded[state] + ((len(keyword), value),)
+        else:
+            self.out[state] = self.out[state] | {value}
+        self.values.add(value)
+
+    def _link(self):
+        queue = deque(self.goto[0].values())
+
+        while queue:
+            state = queue.popleft()
+            for ch, nxt in self.goto[state].items():
+                queue.append(nxt)
+
+                f = self.fail[state]
+                while f and ch not in self.goto[f]:
+                    f = self.fail[f]
+                self.fail[nxt] = self.goto[f].get(ch, 0)
+                self.out[nxt] = self.out[nxt] | self.out[self.fail[nxt]]
+                self.bounded[nxt] = self.bounded[nxt] + self.bounded[self.fail[nxt]]
+
+    def find(self, text):
+        if len(self.patterns) <= self.linear_scan_threshold:
+            whole_words = self.whole_words
+            return {
+                value for keyword, value in self.patterns
+                if (has_word(text, keyword) if keyword in whole_words else keyword in text)
+            }
+
+        goto = self.goto
+        fail = self.fail
+        out = self.out
+        bounded = self.bounded
+        alphabet = self.alphabet
+        total = len(self.values)
+        end = len(text) - 1
+
+        found = set()
+        state = 0
+
+        for i, ch in enumerate(text):
+            if ch not in alphabet:
+                state = 0
+                continue
+
+            while state and ch not in goto[state]:
+                state = fail[state]
+            state = goto[state].get(ch, 0)
+
+            if out[state]:
+                found |= out[state]
+                if len(found) == total:
+                    break
+
+            if bounded[state] and (i == end or not is_word_char(text[i + 1])):
+                for length, value in bounded[state]:
+                    start = i - length
+                    if start < 0 or not is_word_char(text[start]):
+                        found.add(value)
+                if len(found) == total:
+                    break
+
+        return found
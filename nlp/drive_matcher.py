@@ -0,0 +1,95 @@
+# Resume x job-description compatibility for a placement drive.
+#
+# Every resume and every JD is tokenized exactly once into sparse skill and
+# keyword vectors. Match % and ATS scores for all pairs then come from two
+# sparse matrix products, produced in row chunks so an N x M drive never
+# has to exist as one dense matrix.
+
+from itertools import islice
+
+import numpy as np
+
+from nlp.skill_extractor import SKILLS, extract_keywords, find_skills
+from nlp.tokenizer import tokenize
+from nlp.vectorize import binary_csr, build_vocabulary, percentage
+
+
+class DriveMatcher:
+
+    def __init__(self, job_descriptions, skills=SKILLS):
+        job_descriptions = list(job_descriptions)
+
+        self.skill_pos = {s: i for i, s in enumerate(skills)}
+
+        job_docs = [tokenize(jd) for jd in job_descriptions]
+        job_skills = [find_skills(doc) for doc in job_docs]
+        job_keywords = [set(extract_keywords(doc)) for doc in job_docs]
+
+        self.keyword_pos = build_vocabulary(job_keywords)
+
+        # stored transposed (features x jobs) for the resume @ jobs products
+        self.job_skill_matrix = binary_csr(
+            [[self.skill_pos[s] for s in js] for js in job_skills],
+            len(self.skill_pos)
+        ).T.tocsc()
+        self.job_keyword_matrix = binary_csr(
+            [[self.keyword_pos[k] for k in jk] for jk in job_keywords],
+            len(self.keyword_pos)
+        ).T.tocsc()
+
+        self.job_skill_counts = np.array([len(js) for js in job_skills], dtype=float)
+        self.job_keyword_counts = np.array([len(jk) for jk in job_keywords], dtype=float)
+
+    @property
+    def n_jobs(self):
+        return len(self.job_skill_counts)
+
+    def vectorize(self, resumes):
+        skill_rows = []
+        keyword_rows = []
+
+        for text in resumes:
+            doc = tokenize(text)
+            skill_rows.append([self.skill_pos[s] for s in find_skills(doc)])
+            # keywords no JD asks for cannot contribute to any ATS score
+            keyword_rows.append([
+                self.keyword_pos[k] for k in extract_keywords(doc)
+                if k in self.keyword_pos
+            ])
+
+        return (
+            binary_csr(skill_rows, len(self.skill_pos)),
+            binary_csr(keyword_rows, len(self.keyword_pos)),
+        )
+
+    def iter_scores(self, resumes, chunk_size=1000):
+        # yields (first_row, match_block, ats_block); each block is at most
+        # chunk_size x n_jobs. `resumes` may be any iterable, e.g. a stream.
+        resumes = iter(resumes)
+        first_row = 0
+
+        while True:
+            chunk = list(islice(resumes, chunk_size))
+            if not chunk:
+                return
+
+            skill_vecs, keyword_vecs = self.vectorize(chunk)
+
+            skill_hits = (skill_vecs @ self.job_skill_matrix).toarray()
+            keyword_hits = (keyword_vecs @ self.job_keyword_matrix).toarray()
+
+            yield (
+                first_row,
+                percentage(skill_hits, self.job_skill_counts),
+                percentage(keyword_hits, self.job_keyword_counts),
+            )
+            first_row += len(chunk)
+
+    def top_matches(self, resumes, k=10, chunk_size=1000):
+        # best k jobs per resume by match %, ties broken by ATS score
+        k = min(k, self.n_jobs)
+
+        for first_row, match, ats in self.iter_scores(resumes, chunk_size):
+            for i in range(len(match)):
+                order = np.lexsort((-ats[i], -match[i]))[:k]
+                yield first_row + i, [(int(j), float(match[i, j]), float(ats[i, j])) for j in order]
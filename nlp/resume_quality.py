@@ -1,6 +1,18 @@
+import sys
+from functools import lru_cache
+
+import numpy as np
+
+from nlp.tokenizer import tokenize
+from nlp.vectorize import py_round
+from utils.metrics import span
+
+
+@span("calculate_resume_quality")
 def calculate_resume_quality(resume_text, resume_skills):
-    word_count = len(resume_text.split())
-    numbers_found = sum(c.isdigit() for c in resume_text)
+    doc = tokenize(resume_text)
+    word_count = doc.word_count
+    numbers_found = doc.digit_count
 
     score = (
         min(word_count / 200, 1) * 4 +
@@ -8,4 +20,116 @@ def calculate_resume_quality(resume_text, resume_skills):
         min(numbers_found / 10, 1) * 2
     )
 
-    return round(score, 2)
\ No newline at end of file
+    return round(score, 2)
+
+
+# ---------- BATCH (pandas) ----------
+# Word and digit counts are computed over the code points of many resumes at
+# once: texts are joined, viewed as a uint32 array and classified through
+# lookup tables built from str.isspace / str.isdigit, so the counts agree
+# exactly with str.split() and str.isdigit().
+
+BATCH_CHARS = 8_000_000  # code points per numpy pass (~32 MB)
+
+
+@lru_cache(maxsize=None)
+def _char_tables():
+    space = [cp for cp in range(sys.maxunicode + 1) if chr(cp).isspace()]
+    digit = [cp for cp in range(sys.maxunicode + 1) if chr(cp).isdigit()]
+
+    space_table = np.zeros(max(space) + 2, dtype=bool)
+    space_table[space] = True
+    digit_table = np.zeros(max(digit) + 2, dtype=bool)
+    digit_table[digit] = True
+
+    return space_table, digit_table
+
+
+def _classify(codes, table, ascii_mask):
+    mask = ascii_mask(codes)
+
+    # non-ASCII code points go through the full lookup table; the last
+    # table entry is False and absorbs everything past its end
+    other = np.flatnonzero(codes > 127)
+    if other.size:
+        mask[other] = table[np.minimum(codes[other], len(table) - 1)]
+
+    return mask
+
+
+def _ascii_space(codes):
+    return (codes == 32) | ((codes >= 9) & (codes <= 13)) | ((codes >= 28) & (codes <= 31))
+
+
+def _ascii_digit(codes):
+    return (codes >= 48) & (codes <= 57)
+
+
+def _count_chunk(texts):
+    space_table, digit_table = _char_tables()
+
+    # separator space keeps words of neighbouring texts apart
+    joined = " ".join(texts)
+    if joined.isascii():
+        codes = np.frombuffer(joined.encode("ascii"), dtype=np.uint8)
+    else:
+        codes = np.frombuffer(joined.encode("utf-32-le", "surrogatepass"), dtype=np.uint32)
+
+    is_space = _classify(codes, space_table, _ascii_space)
+    word_start = ~is_space
+    word_start[1:] &= is_space[:-1]
+
+    word_idx = np.flatnonzero(word_start)
+    digit_idx = np.flatnonzero(_classify(codes, digit_table, _ascii_digit))
+
+    lengths = np.fromiter(map(len, texts), dtype=np.int64, count=len(texts))
+    starts = np.concatenate(([0], np.cumsum(lengths + 1)[:-1]))
+    ends = starts + lengths
+
+    words = np.searchsorted(word_idx, ends) - np.searchsorted(word_idx, starts)
+    digits = np.searchsorted(digit_idx, ends) - np.searchsorted(digit_idx, starts)
+    return words, digits
+
+
+def _iter_chunks(texts):
+    chunk = []
+    size = 0
+
+    for text in texts:
+        chunk.append(text)
+        size += len(text) + 1
+        if size >= BATCH_CHARS:
+            yield chunk
+            chunk = []
+            size = 0
+
+    if chunk:
+        yield chunk
+
+
+@span("calculate_resume_quality_batch")
+def calculate_resume_quality_batch(resume_texts, skill_counts):
+    # resume_texts: Series of resume text; skill_counts: Series / array of
+    # len(resume_skills) per row. Returns a float array equal, element by
+    # element, to calculate_resume_quality.
+    texts = resume_texts.fillna("").tolist()
+
+    word_count = np.zeros(len(texts))
+    numbers_found = np.zeros(len(texts))
+
+    offset = 0
+    for chunk in _iter_chunks(texts):
+        words, digits = _count_chunk(chunk)
+        word_count[offset:offset + len(chunk)] = words
+        numbers_found[offset:offset + len(chunk)] = digits
+        offset += len(chunk)
+
+    skill_counts = np.asarray(skill_counts, dtype=float)
+
+    score = (
+        np.minimum(word_count / 200, 1) * 4 +
+        np.minimum(skill_counts / 6, 1) * 4 +
+        np.minimum(numbers_found / 10, 1) * 2
+    )
+
+    return py_round(score, 2)
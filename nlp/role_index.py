@@ -0,0 +1,29 @@
+# Skills, ATS keywords and difficulty for every predefined role, extracted
+# once at import. The job descriptions in config/roles.py never change, so
+# per-request work only has to process the resume; "Custom" roles still
+# go through live extraction.
+
+from config.roles import role_descriptions, role_difficulty
+from nlp.skill_extractor import extract_keywords, find_skills
+
+
+def build_role_index(descriptions=role_descriptions, difficulty=role_difficulty):
+    index = {}
+
+    for role, jd in descriptions.items():
+        index[role] = {
+            "skills": find_skills(jd),
+            "keywords": frozenset(extract_keywords(jd)),
+            "difficulty": difficulty.get(role, 1.0),
+        }
+
+    return index
+
+
+ROLE_INDEX = build_role_index()
+
+
+def get_role_entry(role):
+    if role == "Custom":
+        return None
+    return ROLE_INDEX.get(role)
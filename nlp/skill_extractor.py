@@ -1,37 +1,65 @@
+from nlp.aho_corasick import KeywordAutomaton
+from nlp.taxonomy import load_taxonomy
+from nlp.tokenizer import TokenizedDocument, tokenize
+from utils.metrics import span
 
-SKILLS = {
-    "python": ["python"],
-    "sql": ["sql"],
-    "machine learning": ["machine learning", "ml"],
-    "data analysis": ["data analysis", "analysis"],
-    "git": ["git", "github"],
-    "communication": ["communication", "presentation", "teamwork"],
-}
+# canonical skill -> aliases, compiled from data/skills.json
+TAXONOMY = load_taxonomy()
+SKILLS = TAXONOMY["skills"]
+WHOLE_WORDS = TAXONOMY["whole_words"]
 
-def extract_skills(resume_text, job_description):
-    resume_clean = resume_text.lower()
-    job_clean = job_description.lower()
+_matcher = TAXONOMY["matcher"]
+_matcher_source = SKILLS
+
+
+def get_skill_matcher():
+    global _matcher, _matcher_source
+
+    # prebuilt with the taxonomy; rebuilt only if SKILLS is replaced
+    if _matcher is None or _matcher_source is not SKILLS:
+        _matcher = build_skill_matcher(SKILLS)
+        _matcher_source = SKILLS
+
+    return _matcher
+
+
+def build_skill_matcher(skills, whole_words=WHOLE_WORDS):
+    automaton = KeywordAutomaton(
+        ((k, skill) for skill, keywords in skills.items() for k in keywords),
+        whole_words
+    )
+    order = {skill: i for i, skill in enumerate(skills)}
+    return automaton, order
 
-    resume_skills = []
-    job_skills = []
 
-    for skill, keywords in SKILLS.items():
-        if any(k in resume_clean for k in keywords):
-            resume_skills.append(skill)
+@span("find_skills")
+def find_skills(text, matcher=None):
+    automaton, order = matcher or get_skill_matcher()
+    # raw strings only need lowercasing, not a full TokenizedDocument
+    lower = text.lower if isinstance(text, TokenizedDocument) else text.lower()
+    return sorted(automaton.find(lower), key=order.__getitem__)
 
-        if any(k in job_clean for k in keywords):
-            job_skills.append(skill)
+
+@span("extract_skills")
+def extract_skills(resume_text, job_description):
+    matcher = get_skill_matcher()
+
+    resume_skills = find_skills(resume_text, matcher)
+    job_skills = find_skills(job_description, matcher)
 
     return resume_skills, job_skills
 
-def extract_keywords(text):
-    words = text.lower().replace(",", " ").split()
 
-    stopwords = {
-        "the","and","with","for","a","an","to","of","in",
-        "role","candidate","should","experience","looking",
-        "we","are","required","skills","job","work"
-    }
+STOPWORDS = {
+    "the","and","with","for","a","an","to","of","in",
+    "role","candidate","should","experience","looking",
+    "we","are","required","skills","job","work"
+}
+
+
+@span("extract_keywords")
+def extract_keywords(text):
+    words = tokenize(text).keyword_tokens
 
-    keywords = [w for w in words if w not in stopwords and len(w) > 2]
+    keywords = [w for w in words if w not in STOPWORDS and len(w) > 2]
     return list(set(keywords))
\ No newline at end of file
@@ -0,0 +1,187 @@
+# Skill taxonomy: canonical skills and their aliases, grouped by role family.
+#
+# The source is data/skills.json (or a CSV with family,skill,alias columns).
+# It is compiled into an alias -> skill index plus a keyword automaton. The
+# index (plain data, not the automaton) is pickled under the cache directory
+# ($PLACEMENTIQ_CACHE_DIR, default ~/.cache/placementiq) and reused until the
+# source file or this module changes; if no cache directory is writable the
+# taxonomy is simply compiled in memory on every start.
+#
+# Aliases match as substrings ("debug" also finds "debugging"). An alias
+# written as \bapi\b ("\\bapi\\b" in JSON) only matches as a whole word:
+# "REST API." and "api-first" hit it, "rapid" does not.
+
+import csv
+import hashlib
+import json
+import os
+import pickle
+from pathlib import Path
+
+from nlp.aho_corasick import KeywordAutomaton
+
+TAXONOMY_PATH = Path(__file__).resolve().parent.parent / "data" / "skills.json"
+WORD_MARK = "\\b"
+
+
+def _read_json(path):
+    with open(path, encoding="utf-8") as f:
+        data = json.load(f)
+
+    families = data.get("families")
+    if families is None:
+        # flat {skill: [aliases]} file
+        families = {"general": data}
+
+    return [
+        (family, skill, aliases)
+        for family, skills in families.items()
+        for skill, aliases in skills.items()
+    ]
+
+
+def _read_csv(path):
+    rows = {}
+
+    with open(path, encoding="utf-8", newline="") as f:
+        for row in csv.DictReader(f):
+            skill = row["skill"].strip().lower()
+            family = (row.get("family") or "general").strip()
+            alias = (row.get("alias") or skill).lower()
+
+            entry = rows.setdefault(skill, (family, skill, []))
+            if alias not in entry[2]:
+                entry[2].append(alias)
+
+    return list(rows.values())
+
+
+def parse_alias(alias):
+    # "\\bjava\\b" -> ("java", True)
+    if len(alias) > 2 * len(WORD_MARK) and alias.startswith(WORD_MARK) and alias.endswith(WORD_MARK):
+        return alias[len(WORD_MARK):-len(WORD_MARK)], True
+    return alias, False
+
+
+def _index_data(entries):
+    # plain dicts, lists and sets only: this is what the index pickles
+    skills = {}
+    families = {}
+    alias_index = {}
+    whole_words = set()
+
+    for family, skill, aliases in entries:
+        skill = skill.lower()
+        aliases = [a.lower() for a in aliases] or [skill]
+
+        skills.setdefault(skill, [])
+        families[skill] = family
+
+        for alias in aliases:
+            alias, whole_word = parse_alias(alias)
+            if whole_word:
+                whole_words.add(alias)
+            if alias not in skills[skill]:
+                skills[skill].append(alias)
+            alias_index.setdefault(alias, [])
+            if skill not in alias_index[alias]:
+                alias_index[alias].append(skill)
+
+    return {
+        "skills": skills,
+        "families": families,
+        "alias_index": alias_index,
+        "whole_words": frozenset(whole_words),
+    }
+
+
+def _with_matcher(data):
+    automaton = KeywordAutomaton(
+        ((alias, skill) for alias, owners in data["alias_index"].items() for skill in owners),
+        data["whole_words"]
+    )
+    order = {skill: i for i, skill in enumerate(data["skills"])}
+    return dict(data, matcher=(automaton, order))
+
+
+def compile_taxonomy(entries):
+    return _with_matcher(_index_data(entries))
+
+
+def _cache_dir():
+    if os.environ.get("PLACEMENTIQ_CACHE_DIR"):
+        return Path(os.environ["PLACEMENTIQ_CACHE_DIR"])
+    base = os.environ.get("XDG_CACHE_HOME")
+    if not base:
+        try:
+            base = Path.home() / ".cache"
+        except RuntimeError:
+            # no home directory (e.g. a locked-down service account)
+            return None
+    return Path(base) / "placementiq"
+
+
+def _index_path(path):
+    # one index per source file, wherever it lives; None without a cache dir
+    cache_dir = _cache_dir()
+    if cache_dir is None:
+        return None
+    tag = hashlib.sha256(str(path.resolve()).encode("utf-8")).hexdigest()[:16]
+    return cache_dir / f"{path.stem}-{tag}.index.pkl"
+
+
+def _fingerprint(path):
+    # the source data plus this compiler, so editing either rebuilds the index
+    digest = hashlib.sha256()
+    with open(path, "rb") as f:
+        digest.update(f.read())
+    with open(__file__, "rb") as f:
+        digest.update(f.read())
+    return digest.hexdigest()
+
+
+def _read_index(index_path, fingerprint):
+    try:
+        with open(index_path, "rb") as f:
+            cached = pickle.load(f)
+        if cached["fingerprint"] == fingerprint:
+            return cached["data"]
+    except Exception:
+        pass
+    return None
+
+
+def _write_index(index_path, fingerprint, data):
+    tmp = index_path.with_name(f"{index_path.name}.{os.getpid()}.tmp")
+    try:
+        index_path.parent.mkdir(parents=True, exist_ok=True)
+        with open(tmp, "wb") as f:
+            pickle.dump({"fingerprint": fingerprint, "data": data}, f,
+                        protocol=pickle.HIGHEST_PROTOCOL)
+        os.replace(tmp, index_path)
+    except OSError:
+        # no writable cache dir: keep the in-memory build
+        pass
+
+
+def load_taxonomy(path=TAXONOMY_PATH, use_index=True):
+    # the index holds plain data; the automaton is always built fresh from
+    # it, so a pickled matcher can never outlive a change to its code
+    path = Path(path)
+    fingerprint = _fingerprint(path)
+    index_path = _index_path(path) if use_index else None
+
+    data = _read_index(index_path, fingerprint) if index_path else None
+    if data is not None:
+        return _with_matcher(data)
+
+    if path.suffix.lower() == ".csv":
+        entries = _read_csv(path)
+    else:
+        entries = _read_json(path)
+
+    data = _index_data(entries)
+    if index_path:
+        _write_index(index_path, fingerprint, data)
+
+    return _with_matcher(data)
@@ -0,0 +1,30 @@
+# One pass of lowercasing / splitting per text, shared by skill extraction,
+# ATS keywords, resume quality and validation. Those functions accept either
+# raw text or a TokenizedDocument.
+
+
+class TokenizedDocument:
+    __slots__ = ("text", "lower", "words", "unique_words", "keyword_tokens",
+                 "word_count", "digit_count")
+
+    def __init__(self, text):
+        self.text = text
+        self.lower = text.lower()
+
+        # whitespace tokens, as str.split() gives them
+        self.words = self.lower.split()
+        self.unique_words = set(self.words)
+        self.word_count = len(self.words)
+
+        # ATS tokens additionally split on commas
+        self.keyword_tokens = [
+            part for w in self.words for part in w.split(",") if part
+        ]
+
+        self.digit_count = sum(map(str.isdigit, text))
+
+
+def tokenize(text):
+    if isinstance(text, TokenizedDocument):
+        return text
+    return TokenizedDocument(text)
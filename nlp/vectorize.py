@@ -0,0 +1,40 @@
+import numpy as np
+
+
+def binary_csr(rows, n_cols):
+    # rows: one list of column indices per row. scipy is imported here, on
+    # first use, so importing the NLP modules doesn't pay for it.
+    from scipy import sparse
+
+    indptr = np.cumsum([0] + [len(r) for r in rows])
+    indices = np.fromiter((i for r in rows for i in r), dtype=np.int64, count=indptr[-1])
+    data = np.ones(len(indices), dtype=np.float64)
+    return sparse.csr_matrix((data, indices, indptr), shape=(len(rows), n_cols))
+
+
+def build_vocabulary(item_sets):
+    vocab = {}
+    for items in item_sets:
+        for item in items:
+            vocab.setdefault(item, len(vocab))
+    return vocab
+
+
+def percentage(hits, counts):
+    # hits / counts * 100 rounded like the scalar pipeline; 0 where counts == 0
+    with np.errstate(divide="ignore", invalid="ignore"):
+        return np.where(counts > 0, py_round(hits / counts * 100, 2), 0.0)
+
+
+def py_round(values, ndigits=2):
+    # np.round scales, rounds and unscales, which can land on the other side
+    # of a .5 tie from Python's round(); redo just those elements in Python
+    values = np.asarray(values, dtype=float)
+    rounded = np.round(values, ndigits)
+
+    scaled = values * 10 ** ndigits
+    near_tie = np.abs(scaled - np.floor(scaled) - 0.5) < 1e-6
+    if near_tie.any():
+        rounded[near_tie] = [round(v, ndigits) for v in values[near_tie]]
+
+    return rounded
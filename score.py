@@ -0,0 +1,116 @@
+# Headless bulk scoring: runs the same pipeline as the Analyze button over
+# a CSV / JSONL file of student profiles, chunk by chunk.
+#
+#   python score.py students.csv -o scored.csv
+#
+# Input columns: cgpa, internship, projects, communication, dsa_score,
+# hackathons, role, resume_text and optionally job_description (falls back
+# to the predefined description for the role). Any other columns (ids,
+# names, ...) are copied to the output.
+
+import argparse
+import sys
+import time
+
+import joblib
+import numpy as np
+import pandas as pd
+
+from config.roles import role_difficulty
+from core.analysis import match_texts
+from models.predictor import predict_placement_batch
+from nlp.resume_quality import calculate_resume_quality
+from nlp.role_index import get_role_entry
+from utils.validation import validate_resume_text
+
+TEXT_COLUMNS = ["resume_text", "job_description"]
+
+
+def read_chunks(path, chunksize):
+    if path.endswith((".jsonl", ".json")):
+        return pd.read_json(path, lines=True, chunksize=chunksize)
+    return pd.read_csv(path, chunksize=chunksize)
+
+
+def write_chunk(df, path, first):
+    if path.endswith((".jsonl", ".json")):
+        text = df.to_json(orient="records", lines=True)
+        if not text.endswith("\n"):
+            text += "\n"
+        with open(path, "w" if first else "a", encoding="utf-8") as f:
+            f.write(text)
+    else:
+        df.to_csv(path, mode="w" if first else "a", header=first, index=False)
+
+
+def analyze_texts(resume_text, job_description, role_entry=None):
+    # role_entry: precomputed JD skills/keywords (nlp.role_index) when the
+    # row uses a predefined role's description
+    text = match_texts(resume_text, job_description, role_entry)
+    resume_doc = text["resume_doc"]
+
+    resume_quality = calculate_resume_quality(resume_doc, text["resume_skills"])
+    is_valid, msg = validate_resume_text(resume_doc)
+
+    return text["match_percentage"], text["ats_score"], resume_quality, is_valid, msg
+
+
+def score_chunk(model, chunk):
+    resumes = chunk["resume_text"].fillna("").astype(str)
+
+    if "job_description" in chunk:
+        jds = chunk["job_description"].fillna("").astype(str)
+    else:
+        jds = pd.Series("", index=chunk.index)
+
+    rows = [
+        analyze_texts(r, jd) if jd.strip() else analyze_texts(r, "", get_role_entry(role))
+        for r, jd, role in zip(resumes, jds, chunk["role"])
+    ]
+
+    out = chunk.drop(columns=[c for c in TEXT_COLUMNS if c in chunk])
+    out["match_percentage"] = [r[0] for r in rows]
+    out["ats_score"] = [r[1] for r in rows]
+    out["resume_quality"] = [r[2] for r in rows]
+    out["valid"] = [r[3] for r in rows]
+    out["message"] = [r[4] for r in rows]
+
+    ok, probability = predict_placement_batch(model, out, role_difficulty)
+    if not ok:
+        raise ValueError(f"Prediction failed: {probability}")
+
+    out["probability"] = np.where(out["valid"], probability, np.nan)
+    return out
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Bulk-score student profiles.")
+    parser.add_argument("input", help="CSV or JSONL file of profiles")
+    parser.add_argument("-o", "--output", default="scored.csv", help="CSV or JSONL output path")
+    parser.add_argument("--model", default="models/placement_model.pkl")
+    parser.add_argument("--chunksize", type=int, default=5000)
+    args = parser.parse_args(argv)
+
+    model = joblib.load(args.model)
+
+    total = 0
+    start = time.perf_counter()
+
+    for i, chunk in enumerate(read_chunks(args.input, args.chunksize)):
+        scored = score_chunk(model, chunk)
+        write_chunk(scored, args.output, first=(i == 0))
+
+        total += len(scored)
+        elapsed = time.perf_counter() - start
+        print(f"{total} rows  {total / elapsed:,.0f} rows/sec", file=sys.stderr)
+
+    elapsed = time.perf_counter() - start
+    print(
+        f"Scored {total} rows in {elapsed:.2f}s "
+        f"({total / max(elapsed, 1e-9):,.0f} rows/sec) -> {args.output}",
+        file=sys.stderr
+    )
+
+
+if __name__ == "__main__":
+    main()
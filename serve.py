@@ -0,0 +1,378 @@
+# HTTP JSON scoring service for the campus portal.
+#
+#   python serve.py --port 8000 --workers 2
+#
+#   POST /score         one profile  -> scores, skills and missing skills
+#   POST /score/batch   {"profiles": [...]} -> one row per profile
+#   GET  /stats         request counts and p50/p99 latency per endpoint
+#   GET  /metrics       Prometheus text: per-stage latency histograms and
+#                       counters (needs PLACEMENTIQ_METRICS=1, see utils/metrics.py)
+#
+# Profiles use the score.py columns: cgpa, internship, projects,
+# communication, dsa_score, hackathons, role, resume_text and optionally
+# job_description (falls back to the predefined description for the role).
+#
+# The event loop only parses HTTP. Scoring runs in a process pool whose
+# workers each load the model once at startup (--workers 0 scores in a
+# thread of this process instead).
+
+import argparse
+import asyncio
+import json
+import math
+import os
+import signal
+import sys
+import time
+import warnings
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+
+import joblib
+import numpy as np
+import pandas as pd
+
+from config.roles import role_difficulty
+from core.analysis import match_texts
+from models.predictor import predict_placement
+from nlp.resume_quality import calculate_resume_quality
+from nlp.role_index import get_role_entry
+from score import score_chunk
+from utils import metrics
+from utils.validation import validate_resume_text
+
+MODEL_PATH = "models/placement_model.pkl"
+MAX_BODY = 16 * 1024 * 1024
+MAX_BATCH = 5000
+LATENCY_WINDOW = 10000   # most recent requests kept per endpoint
+
+NUMERIC_FIELDS = ["cgpa", "internship", "projects", "communication",
+                  "dsa_score", "hackathons"]
+INTEGER_FIELDS = NUMERIC_FIELDS[1:]
+PROFILE_FIELDS = NUMERIC_FIELDS + ["role", "resume_text"]
+ENDPOINTS = ("/score", "/score/batch", "/stats", "/metrics")
+PROMETHEUS_CONTENT_TYPE = "text/plain; version=0.0.4; charset=utf-8"
+
+REASONS = {200: "OK", 400: "Bad Request", 404: "Not Found",
+           405: "Method Not Allowed", 413: "Payload Too Large",
+           500: "Internal Server Error"}
+
+
+class BadRequest(Exception):
+    pass
+
+
+# ---------- WORKER SIDE ----------
+_model = None
+
+
+def init_worker(model_path):
+    global _model
+    # predict_placement passes a plain array; don't log that once per request
+    warnings.filterwarnings("ignore", message="X does not have valid feature names")
+    _model = joblib.load(model_path)
+
+
+def _check_profile(profile):
+    if not isinstance(profile, dict):
+        raise BadRequest("Each profile must be a JSON object.")
+
+    missing = [f for f in PROFILE_FIELDS if f not in profile]
+    if missing:
+        raise BadRequest(f"Missing fields: {', '.join(missing)}")
+
+    if not isinstance(profile["role"], str):
+        raise BadRequest("Field role must be a string.")
+
+    # converted once here, so /score and /score/batch see the same values
+    profile = dict(profile)
+    for field in NUMERIC_FIELDS:
+        try:
+            value = float(profile[field])
+        except (TypeError, ValueError):
+            raise BadRequest(f"Field {field} must be a number.")
+
+        if not math.isfinite(value):
+            raise BadRequest(f"Field {field} must be a number.")
+        if field in INTEGER_FIELDS:
+            if not value.is_integer():
+                raise BadRequest(f"Field {field} must be a whole number.")
+            value = int(value)
+        profile[field] = value
+
+    return profile
+
+
+def score_profile(profile):
+    resume_text = str(profile["resume_text"] or "")
+    job_description = str(profile.get("job_description") or "")
+    role = profile["role"]
+
+    if job_description.strip():
+        text = match_texts(resume_text, job_description)
+    else:
+        text = match_texts(resume_text, "", get_role_entry(role))
+
+    resume_doc = text["resume_doc"]
+    resume_quality = calculate_resume_quality(resume_doc, text["resume_skills"])
+    valid, message = validate_resume_text(resume_doc)
+
+    probability = None
+    if valid:
+        ok, probability = predict_placement(
+            _model,
+            profile["cgpa"],
+            profile["internship"],
+            profile["communication"],
+            text["match_percentage"],
+            profile["projects"],
+            profile["dsa_score"],
+            resume_quality,
+            profile["hackathons"],
+            role,
+            role_difficulty
+        )
+        if not ok:
+            raise BadRequest(f"Prediction failed: {probability}")
+        probability = float(probability)
+
+    return {
+        "match_percentage": float(text["match_percentage"]),
+        "ats_score": float(text["ats_score"]),
+        "resume_quality": float(resume_quality),
+        "probability": probability,
+        "valid": valid,
+        "message": message,
+        "resume_skills": text["resume_skills"],
+        "missing_skills": sorted(text["missing_skills"]),
+    }
+
+
+def run_traced(fn, *args):
+    # spans recorded in a worker process travel back with the result
+    return fn(*args), metrics.drain()
+
+
+def score_batch(profiles):
+    chunk = pd.DataFrame(profiles)
+    out = score_chunk(_model, chunk)
+
+    rows = out.astype(object).where(out.notna(), None).to_dict(orient="records")
+    for row in rows:
+        for k, v in row.items():
+            if isinstance(v, np.generic):
+                row[k] = v.item()
+    return rows
+
+
+# ---------- LATENCY STATS ----------
+class LatencyStats:
+
+    def __init__(self, window=LATENCY_WINDOW):
+        self.window = window
+        self.started = time.time()
+        self.endpoints = {}
+
+    def record(self, endpoint, seconds, ok):
+        entry = self.endpoints.setdefault(endpoint, {
+            "count": 0,
+            "errors": 0,
+            "latencies": deque(maxlen=self.window),
+        })
+        entry["count"] += 1
+        if not ok:
+            entry["errors"] += 1
+        entry["latencies"].append(seconds)
+
+    def snapshot(self):
+        endpoints = {}
+
+        for endpoint, entry in self.endpoints.items():
+            lat = np.fromiter(entry["latencies"], dtype=float)
+            p50, p99 = np.percentile(lat, [50, 99]) * 1000 if len(lat) else (0.0, 0.0)
+            endpoints[endpoint] = {
+                "count": entry["count"],
+                "errors": entry["errors"],
+                "p50_ms": round(float(p50), 2),
+                "p99_ms": round(float(p99), 2),
+            }
+
+        return {
+            "uptime_s": round(time.time() - self.started, 1),
+            "endpoints": endpoints,
+        }
+
+
+# ---------- HTTP ----------
+class ScoringServer:
+
+    def __init__(self, model_path=MODEL_PATH, workers=1):
+        self.workers = workers
+
+        if workers > 0:
+            self.executor = ProcessPoolExecutor(
+                max_workers=workers, initializer=init_worker, initargs=(model_path,)
+            )
+        else:
+            init_worker(model_path)
+            self.executor = ThreadPoolExecutor(max_workers=1)
+
+        self.stats = LatencyStats()
+
+    async def warm_up(self):
+        # start every worker (and its model load) before taking traffic
+        loop = asyncio.get_running_loop()
+        await asyncio.gather(*[
+            loop.run_in_executor(self.executor, time.sleep, 0.05)
+            for _ in range(max(self.workers, 1))
+        ])
+
+    async def _run(self, fn, *args):
+        loop = asyncio.get_running_loop()
+        result, spans = await loop.run_in_executor(self.executor, run_traced, fn, *args)
+        metrics.merge(spans)
+        return result
+
+    async def dispatch(self, method, path, body):
+        if path in ("/stats", "/metrics"):
+            if method != "GET":
+                return 405, {"error": "Use GET."}
+            if path == "/metrics":
+                return 200, metrics.prometheus_text()
+            return 200, self.stats.snapshot()
+
+        if path not in ENDPOINTS:
+            return 404, {"error": f"Unknown path {path}"}
+
+        if method != "POST":
+            return 405, {"error": "Use POST."}
+
+        try:
+            payload = json.loads(body or b"null")
+        except ValueError:
+            raise BadRequest("Body is not valid JSON.")
+
+        if path == "/score":
+            return 200, await self._run(score_profile, _check_profile(payload))
+
+        profiles = payload.get("profiles") if isinstance(payload, dict) else payload
+        if not isinstance(profiles, list) or not profiles:
+            raise BadRequest('Send {"profiles": [...]} with at least one profile.')
+        if len(profiles) > MAX_BATCH:
+            raise BadRequest(f"At most {MAX_BATCH} profiles per batch.")
+        profiles = [_check_profile(profile) for profile in profiles]
+
+        return 200, {"results": await self._run(score_batch, profiles)}
+
+    async def handle(self, reader, writer):
+        try:
+            while True:
+                request_line = await reader.readline()
+                if not request_line:
+                    break
+
+                try:
+                    method, target, version = request_line.decode("latin-1").split()
+                except ValueError:
+                    break
+
+                headers = {}
+                while True:
+                    line = await reader.readline()
+                    if line in (b"\r\n", b"\n", b""):
+                        break
+                    name, _, value = line.decode("latin-1").partition(":")
+                    headers[name.strip().lower()] = value.strip()
+
+                try:
+                    length = int(headers.get("content-length") or 0)
+                except ValueError:
+                    length = -1
+                path = target.split("?", 1)[0]
+                start = time.perf_counter()
+
+                if length < 0:
+                    # the body can't be framed, so the connection can't be reused
+                    status, result = 400, {"error": "Invalid Content-Length header."}
+                    keep_alive = False
+                elif length > MAX_BODY:
+                    status, result = 413, {"error": f"Body larger than {MAX_BODY} bytes."}
+                    keep_alive = False
+                else:
+                    body = await reader.readexactly(length) if length else b""
+                    keep_alive = (headers.get("connection", "").lower() != "close"
+                                  and version == "HTTP/1.1")
+                    try:
+                        status, result = await self.dispatch(method, path, body)
+                    except BadRequest as e:
+                        status, result = 400, {"error": str(e)}
+                    except Exception as e:
+                        status, result = 500, {"error": str(e)}
+
+                endpoint = path if path in ENDPOINTS else "other"
+                elapsed = time.perf_counter() - start
+                self.stats.record(endpoint, elapsed, status == 200)
+                metrics.observe(f"http {endpoint}", elapsed, status == 200)
+                metrics.count("http_requests", endpoint=endpoint, status=status)
+
+                if isinstance(result, str):
+                    data, content_type = result.encode("utf-8"), PROMETHEUS_CONTENT_TYPE
+                else:
+                    data, content_type = json.dumps(result).encode("utf-8"), "application/json"
+                writer.write(
+                    f"HTTP/1.1 {status} {REASONS.get(status, '')}\r\n"
+                    f"Content-Type: {content_type}\r\n"
+                    f"Content-Length: {len(data)}\r\n"
+                    f"Connection: {'keep-alive' if keep_alive else 'close'}\r\n"
+                    "\r\n".encode("latin-1") + data
+                )
+                await writer.drain()
+
+                if not keep_alive:
+                    break
+        except (ConnectionError, asyncio.IncompleteReadError):
+            pass
+        finally:
+            writer.close()
+
+    async def serve(self, host, port):
+        await self.warm_up()
+        server = await asyncio.start_server(self.handle, host, port)
+        print(f"Serving on http://{host}:{port} with {self.workers} worker(s)", file=sys.stderr)
+
+        # stop cleanly on Ctrl-C / SIGTERM so the worker processes exit too
+        stop = asyncio.Event()
+        loop = asyncio.get_running_loop()
+        for sig in (signal.SIGINT, signal.SIGTERM):
+            try:
+                loop.add_signal_handler(sig, stop.set)
+            except NotImplementedError:
+                pass
+
+        async with server:
+            await stop.wait()
+
+    def close(self):
+        self.executor.shutdown(cancel_futures=True)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Serve placement scoring over HTTP.")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8000)
+    parser.add_argument("--model", default=MODEL_PATH)
+    parser.add_argument("--workers", type=int, default=os.cpu_count() or 1,
+                        help="scoring processes; 0 scores in-process")
+    args = parser.parse_args(argv)
+
+    server = ScoringServer(args.model, args.workers)
+    try:
+        asyncio.run(server.serve(args.host, args.port))
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.close()
+
+
+if __name__ == "__main__":
+    main()
@@ -1,97 +1,371 @@
+#   python train_model.py                      # 80/20 holdout (original behaviour)
+#   python train_model.py --cv 5 --n-jobs -1   # k-fold CV, fold x model grid in parallel
+#   python train_model.py --incremental --data big.csv --chunksize 50000 [--resume]
+#                                              # out-of-core SGD, checkpointed
+
+import argparse
+import os
+import time
+
 import pandas as pd
 import numpy as np
 import joblib
+from joblib import Parallel, delayed
 
-from sklearn.model_selection import train_test_split
+from sklearn.base import clone
+from sklearn.model_selection import StratifiedKFold, train_test_split
 from sklearn.preprocessing import StandardScaler
 from sklearn.pipeline import Pipeline
-from sklearn.linear_model import LogisticRegression
+from sklearn.linear_model import LogisticRegression, SGDClassifier
 from sklearn.ensemble import RandomForestClassifier, GradientBoostingClassifier
 from sklearn.metrics import accuracy_score, classification_report
 
-# ---------- LOAD DATA ----------
-df = pd.read_csv("data/campus.csv")
-
-# ---------- FEATURE ENGINEERING ----------
-df["cgpa"] = df[["ssc_p","hsc_p","degree_p","mba_p"]].mean(axis=1) / 10
-df["internship"] = df["workex"].apply(lambda x: 1 if x=="Yes" else 0)
-df["communication"] = df["etest_p"] / 10
-df["placed"] = df["status"].apply(lambda x: 1 if x=="Placed" else 0)
-
-# Optional skill match feature
-np.random.seed(42)
-df["skill_match"] = np.random.uniform(20, 100, len(df))
+from models.compact import compact_path, export_compact
 
-# ---------- FEATURES ----------
-X = df[[
+FEATURES = [
     "cgpa",
     "internship",
     "communication",
     "skill_match"
-]]
-y = df["placed"]
+]
 
 
-# ---------- TRAIN TEST ----------
-X_train, X_test, y_train, y_test = train_test_split(
-    X, y, test_size=0.2, random_state=42
-)
+# ---------- FEATURE ENGINEERING ----------
+def engineer_features(df, rng):
+    # rng supplies the synthetic skill_match column; pass the same
+    # RandomState across chunks to get the values a full read would
+    df = df.copy()
+    df["cgpa"] = df[["ssc_p","hsc_p","degree_p","mba_p"]].mean(axis=1) / 10
+    df["internship"] = df["workex"].apply(lambda x: 1 if x=="Yes" else 0)
+    df["communication"] = df["etest_p"] / 10
+    df["placed"] = df["status"].apply(lambda x: 1 if x=="Placed" else 0)
+
+    # Optional skill match feature
+    df["skill_match"] = rng.uniform(20, 100, len(df))
+
+    return df[FEATURES], df["placed"]
+
+
+# ---------- LOAD DATA ----------
+def load_data(path="data/campus.csv"):
+    df = pd.read_csv(path)
+    return engineer_features(df, np.random.RandomState(42))
+
+
+def iter_chunks(path, chunksize, skip=0):
+    # yields (chunk number, X, y); skipped chunks are still read so the
+    # skill_match sequence stays aligned when resuming
+    rng = np.random.RandomState(42)
+
+    for i, chunk in enumerate(pd.read_csv(path, chunksize=chunksize)):
+        X, y = engineer_features(chunk, rng)
+        if i >= skip:
+            yield i, X, y
+
 
 # ---------- MODELS ----------
-models = {
-    "Logistic": Pipeline([
-        ("scaler", StandardScaler()),
-        ("model", LogisticRegression(class_weight="balanced", max_iter=1000))
-    ]),
-    
-    "RandomForest": RandomForestClassifier(n_estimators=200, random_state=42),
-    
-    "GradientBoost": GradientBoostingClassifier(random_state=42)
-}
-
-best_model = None
-best_score = 0
-
-print("\n===== MODEL COMPARISON =====")
-
-for name, m in models.items():
-    m.fit(X_train, y_train)
-    preds = m.predict(X_test)
-    score = accuracy_score(y_test, preds)
-    
-    print(f"{name} Accuracy:", round(score, 4))
-    
-    if score > best_score:
-        best_score = score
-        best_model = m
-
-print("\n===== BEST MODEL REPORT =====")
-final_preds = best_model.predict(X_test)
-print(classification_report(y_test, final_preds))
-
-joblib.dump(best_model, "models/placement_model.pkl")
-print("\nBest model saved with accuracy:", round(best_score,4))
+def build_models():
+    return {
+        "Logistic": Pipeline([
+            ("scaler", StandardScaler()),
+            ("model", LogisticRegression(class_weight="balanced", max_iter=1000))
+        ]),
+
+        "RandomForest": RandomForestClassifier(n_estimators=200, random_state=42),
+
+        "GradientBoost": GradientBoostingClassifier(random_state=42)
+    }
+
+
+# ---------- HOLDOUT ----------
+def select_holdout(models, X, y):
+    X_train, X_test, y_train, y_test = train_test_split(
+        X, y, test_size=0.2, random_state=42
+    )
+
+    best_model = None
+    best_score = 0
+
+    print("\n===== MODEL COMPARISON =====")
+
+    for name, m in models.items():
+        start = time.perf_counter()
+        m.fit(X_train, y_train)
+        fit_time = time.perf_counter() - start
+
+        preds = m.predict(X_test)
+        score = accuracy_score(y_test, preds)
+
+        print(f"{name} Accuracy:", round(score, 4), f"(fit {fit_time:.2f}s)")
+
+        if score > best_score:
+            best_score = score
+            best_model = m
+
+    print("\n===== BEST MODEL REPORT =====")
+    final_preds = best_model.predict(X_test)
+    print(classification_report(y_test, final_preds))
+
+    return best_model, best_score
+
+
+# ---------- K-FOLD CV ----------
+def _fit_fold(name, model, X, y, train_idx, test_idx):
+    start = time.perf_counter()
+    model.fit(X.iloc[train_idx], y.iloc[train_idx])
+    fit_time = time.perf_counter() - start
+
+    score = accuracy_score(y.iloc[test_idx], model.predict(X.iloc[test_idx]))
+    return name, score, fit_time
+
+
+def cross_validate_models(models, X, y, folds=5, n_jobs=-1):
+    # every (model, fold) pair is one task, so all cores stay busy even
+    # when one model is much slower than the others
+    splits = list(StratifiedKFold(n_splits=folds, shuffle=True, random_state=42).split(X, y))
+
+    start = time.perf_counter()
+    results = Parallel(n_jobs=n_jobs)(
+        delayed(_fit_fold)(name, clone(model), X, y, train_idx, test_idx)
+        for name, model in models.items()
+        for train_idx, test_idx in splits
+    )
+    wall_time = time.perf_counter() - start
+
+    summary = {}
+    for name in models:
+        scores = np.array([s for n, s, _ in results if n == name])
+        fit_times = np.array([t for n, _, t in results if n == name])
+        summary[name] = {
+            "mean": scores.mean(),
+            "std": scores.std(),
+            "fit_time": fit_times.mean(),
+            "total_fit_time": fit_times.sum(),
+        }
+
+    return summary, wall_time
+
+
+def select_cv(models, X, y, folds, n_jobs):
+    summary, wall_time = cross_validate_models(models, X, y, folds, n_jobs)
+
+    print(f"\n===== {folds}-FOLD CV COMPARISON =====")
+    print(f"{'Model':<15} {'CV accuracy':>17} {'fit/fold (s)':>13} {'fit total (s)':>14}")
+    for name, r in summary.items():
+        print(f"{name:<15} {r['mean']:>9.4f} ± {r['std']:.4f} "
+              f"{r['fit_time']:>13.3f} {r['total_fit_time']:>14.3f}")
+
+    total = sum(r["total_fit_time"] for r in summary.values())
+    print(f"\nGrid of {len(models) * folds} fits: {wall_time:.2f}s wall, "
+          f"{total:.2f}s of fitting (n_jobs={n_jobs})")
+
+    best_name = max(summary, key=lambda n: summary[n]["mean"])
+    best_model = models[best_name]
+
+    # refit the winner on every row
+    start = time.perf_counter()
+    best_model.fit(X, y)
+    print(f"Refit {best_name} on all {len(X)} rows in {time.perf_counter() - start:.2f}s")
+
+    return best_model, summary[best_name]["mean"]
+
+
+# ---------- INCREMENTAL (OUT-OF-CORE) ----------
+# Streams the CSV chunk by chunk: one pass fits the scaler (and counts
+# classes for balanced weights), then each epoch feeds every chunk to an
+# SGD logistic regression. A checkpoint of the full training state is
+# written every few chunks and at each epoch end; --resume continues from
+# the chunk after the last checkpoint.
+def _new_state():
+    return {
+        "phase": "scale",
+        "epoch": 0,
+        "chunk": 0,
+        "rows": 0,
+        "scaler": StandardScaler(),
+        "model": None,
+        "class_counts": np.zeros(2, dtype=np.int64),
+    }
+
+
+def save_checkpoint(state, path):
+    tmp = f"{path}.tmp"
+    joblib.dump(state, tmp)
+    os.replace(tmp, path)
+
+
+def _train_rows(X, y, holdout_every):
+    if not holdout_every:
+        return X, y
+    keep = X.index % holdout_every != 0
+    return X[keep], y[keep]
+
+
+def holdout_accuracy(scaler, model, path, chunksize, holdout_every):
+    correct = 0
+    total = 0
+
+    for _, X, y in iter_chunks(path, chunksize):
+        held = X.index % holdout_every == 0
+        if held.any():
+            preds = model.predict(scaler.transform(X[held]))
+            correct += int((preds == y[held].to_numpy()).sum())
+            total += int(held.sum())
+
+    return correct / total if total else float("nan")
+
+
+def train_incremental(path, chunksize=50_000, epochs=5, checkpoint=None,
+                      checkpoint_every=10, resume=False, holdout_every=5):
+    if resume and checkpoint and os.path.exists(checkpoint):
+        state = joblib.load(checkpoint)
+        print(f"Resuming: {state['phase']} phase, epoch {state['epoch']}, chunk {state['chunk']}")
+    else:
+        state = _new_state()
+
+    def maybe_checkpoint(i):
+        if checkpoint and checkpoint_every and (i + 1) % checkpoint_every == 0:
+            save_checkpoint(state, checkpoint)
+
+    start = time.perf_counter()
+
+    if state["phase"] == "scale":
+        for i, X, y in iter_chunks(path, chunksize, skip=state["chunk"]):
+            X, y = _train_rows(X, y, holdout_every)
+            state["scaler"].partial_fit(X)
+            state["class_counts"] += np.bincount(y, minlength=2)
+            state["chunk"] = i + 1
+            maybe_checkpoint(i)
+
+        counts = state["class_counts"]
+        # same weights as class_weight="balanced", which partial_fit can't take
+        weights = {c: counts.sum() / (2 * counts[c]) for c in (0, 1) if counts[c]}
+        state["model"] = SGDClassifier(loss="log_loss", class_weight=weights, random_state=42)
+        state.update(phase="train", chunk=0)
+        if checkpoint:
+            save_checkpoint(state, checkpoint)
+        print(f"Scaler fitted on {int(counts.sum())} rows ({time.perf_counter() - start:.2f}s)")
+
+    scaler = state["scaler"]
+    model = state["model"]
+
+    while state["epoch"] < epochs:
+        epoch = state["epoch"]
+
+        for i, X, y in iter_chunks(path, chunksize, skip=state["chunk"]):
+            X, y = _train_rows(X, y, holdout_every)
+            if len(X) == 0:
+                continue
+
+            # per-chunk shuffle, seeded so a resumed run sees the same order
+            order = np.random.RandomState([42, epoch, i]).permutation(len(X))
+            model.partial_fit(scaler.transform(X)[order], y.to_numpy()[order], classes=[0, 1])
+
+            state["rows"] += len(X)
+            state["chunk"] = i + 1
+            maybe_checkpoint(i)
+
+        state.update(epoch=epoch + 1, chunk=0)
+        if checkpoint:
+            save_checkpoint(state, checkpoint)
+
+        line = f"Epoch {epoch + 1}/{epochs}: {state['rows']} rows seen ({time.perf_counter() - start:.2f}s)"
+        if holdout_every:
+            acc = holdout_accuracy(scaler, model, path, chunksize, holdout_every)
+            line += f", holdout accuracy {acc:.4f}"
+        print(line)
+
+    score = holdout_accuracy(scaler, model, path, chunksize, holdout_every) if holdout_every else float("nan")
+    return Pipeline([("scaler", scaler), ("model", model)]), score
+
 
 # ---------- FEATURE IMPORTANCE ----------
-import matplotlib.pyplot as plt
-import numpy as np
+def plot_feature_importance(best_model, features):
+    try:
+        import matplotlib.pyplot as plt
+
+        # If model is inside Pipeline
+        if hasattr(best_model, "named_steps"):
+            coef = best_model.named_steps["model"].coef_[0]
+        else:
+            coef = best_model.coef_[0]
+
+        plt.figure(figsize=(6,4))
+        plt.barh(features, coef)
+        plt.title("Feature Importance (Logistic Regression Coefficients)")
+        plt.xlabel("Impact on Placement Prediction")
+        plt.tight_layout()
+        plt.show()
+
+    except Exception as e:
+        print("Feature importance not available:", e)
+
+
+# ---------- SAVE ----------
+def save_model(model, output):
+    joblib.dump(model, output)
+
+    # sklearn-free copy for the app; a model that can't be exported leaves
+    # any old .npz stale, and the app then falls back to the pickle
+    try:
+        kind = export_compact(model, compact_path(output), source=output)
+        print(f"Compact {kind} scorer saved to {compact_path(output)}")
+    except ValueError as e:
+        print("Compact scorer not exported:", e)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Train the placement model.")
+    parser.add_argument("--data", default="data/campus.csv")
+    parser.add_argument("--output", default="models/placement_model.pkl")
+    parser.add_argument("--cv", type=int, default=0, metavar="K",
+                        help="select the model by K-fold cross-validation instead of one 80/20 split")
+    parser.add_argument("--n-jobs", type=int, default=-1,
+                        help="parallel fits for --cv (-1 = all cores)")
+    parser.add_argument("--incremental", action="store_true",
+                        help="stream --data in chunks and train an SGD logistic model")
+    parser.add_argument("--chunksize", type=int, default=50_000)
+    parser.add_argument("--epochs", type=int, default=5)
+    parser.add_argument("--checkpoint", help="default: <output>.ckpt")
+    parser.add_argument("--checkpoint-every", type=int, default=10, metavar="CHUNKS")
+    parser.add_argument("--resume", action="store_true")
+    parser.add_argument("--holdout-every", type=int, default=5, metavar="N",
+                        help="hold out every Nth row for accuracy (0 = train on all)")
+    parser.add_argument("--no-save", action="store_true")
+    parser.add_argument("--no-plot", action="store_true")
+    args = parser.parse_args(argv)
+
+    if args.incremental:
+        checkpoint = args.checkpoint or f"{args.output}.ckpt"
+        best_model, best_score = train_incremental(
+            args.data, args.chunksize, args.epochs, checkpoint,
+            args.checkpoint_every, args.resume, args.holdout_every
+        )
+
+        if not args.no_save:
+            save_model(best_model, args.output)
+            print("\nIncremental model saved with holdout accuracy:", round(best_score,4))
+            if os.path.exists(checkpoint):
+                os.remove(checkpoint)
+        return
+
+    X, y = load_data(args.data)
+    models = build_models()
 
-try:
-    # If model is inside Pipeline
-    if hasattr(best_model, "named_steps"):
-        coef = best_model.named_steps["model"].coef_[0]
+    if args.cv:
+        best_model, best_score = select_cv(models, X, y, args.cv, args.n_jobs)
+        label = "mean CV accuracy"
     else:
-        coef = best_model.coef_[0]
+        best_model, best_score = select_holdout(models, X, y)
+        label = "accuracy"
 
-    features = X.columns
+    if not args.no_save:
+        save_model(best_model, args.output)
+        print(f"\nBest model saved with {label}:", round(best_score,4))
 
-    plt.figure(figsize=(6,4))
-    plt.barh(features, coef)
-    plt.title("Feature Importance (Logistic Regression Coefficients)")
-    plt.xlabel("Impact on Placement Prediction")
-    plt.tight_layout()
-    plt.show()
+    if not args.no_plot:
+        plot_feature_importance(best_model, X.columns)
 
-except Exception as e:
-    print("Feature importance not available:", e)
 
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,33 @@
+# Finished analyses keyed by everything that can change their outcome, so
+# going back to a previously analyzed slider setting returns instantly.
+
+import hashlib
+import json
+
+from utils.cache import LRUCache
+
+ANALYSIS_CACHE_SIZE = 512      # entries
+ANALYSIS_CACHE_TTL = 30 * 60   # seconds
+
+analysis_cache = LRUCache(ANALYSIS_CACHE_SIZE, sizeof=lambda _: 1, ttl=ANALYSIS_CACHE_TTL)
+
+
+def text_hash(text):
+    return hashlib.sha256(text.encode("utf-8", "surrogatepass")).hexdigest()
+
+
+def analysis_key(cgpa, internship, projects, communication, dsa_score,
+                 hackathons, role, resume_text, job_description, model_version):
+    payload = [
+        round(float(cgpa), 4),
+        int(internship),
+        int(projects),
+        int(communication),
+        int(dsa_score),
+        int(hackathons),
+        role,
+        text_hash(resume_text),
+        text_hash(job_description),
+        model_version,
+    ]
+    return hashlib.sha256(json.dumps(payload).encode("utf-8")).hexdigest()
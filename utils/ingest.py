@@ -0,0 +1,315 @@
+# PDF ingestion queue shared by every Streamlit session in the process.
+#
+# Uploads are parsed by a fixed number of worker processes fed from a
+# bounded FIFO queue, so a burst of uploads queues (or is turned away)
+# instead of starting one CPU-bound parse per session. Each worker is its own
+# process so a job that overruns its timeout can be killed and the slot
+# respawned without touching the other jobs.
+#
+#   queue = get_ingest_queue()
+#   ok, job_id = queue.submit(uploaded_file)   # (False, message) when full
+#   queue.poll(job_id)                         # {"status": ..., "position": ...}
+#   ok, text = queue.result(job_id, wait=10)
+
+import itertools
+import multiprocessing
+import os
+import queue
+import threading
+import time
+from collections import OrderedDict
+
+from utils import metrics
+from utils.pdf_reader import (
+    MAX_CHARS,
+    MAX_PAGES,
+    TIME_BUDGET,
+    get_cached_text,
+    parse_pdf_bytes,
+    pdf_cache_key,
+    put_cached_text,
+    read_pdf_bytes,
+)
+
+INGEST_WORKERS = int(os.environ.get("PLACEMENTIQ_INGEST_WORKERS", 0)) or os.cpu_count() or 1
+MAX_PENDING = 64        # queued jobs before submit() pushes back
+JOB_TIMEOUT = 30.0      # seconds a job may run before its worker is killed
+MAX_FINISHED = 1024     # finished jobs kept for poll() / result()
+
+QUEUE_FULL_MESSAGE = "Resume parser is busy. Please try again in a moment."
+
+
+# ---------- WORKER PROCESS ----------
+def _worker_loop(conn):
+    # utils.pdf_reader imports pdfplumber lazily so the app process never
+    # loads it; load it here while the worker is idle instead of on its
+    # first job
+    import pdfplumber  # noqa: F401
+
+    while True:
+        try:
+            job = conn.recv()
+        except EOFError:
+            return
+
+        if job is None:
+            return
+
+        data, max_pages, max_chars, time_budget = job
+        try:
+            result = True, parse_pdf_bytes(data, 1, max_pages, max_chars, time_budget)
+        except Exception as e:
+            result = False, str(e)
+
+        # spans recorded in this process travel back with the result
+        conn.send((*result, metrics.drain()))
+
+
+class _WorkerSlot:
+
+    def __init__(self):
+        self._start()
+
+    def _start(self):
+        self.conn, child = multiprocessing.Pipe()
+        self.process = multiprocessing.Process(target=_worker_loop, args=(child,), daemon=True)
+        self.process.start()
+        child.close()
+
+    def restart(self):
+        self.process.kill()
+        self.process.join()
+        self.conn.close()
+        self._start()
+
+    def run(self, job, timeout):
+        self.conn.send(job)
+
+        if not self.conn.poll(timeout):
+            self.restart()
+            raise TimeoutError
+
+        return self.conn.recv()
+
+    def close(self):
+        try:
+            self.conn.send(None)
+        except OSError:
+            pass
+        self.process.join(timeout=1)
+        if self.process.is_alive():
+            self.process.kill()
+
+
+# ---------- JOBS ----------
+class IngestJob:
+
+    def __init__(self, job_id, key, data, seq):
+        self.id = job_id
+        self.key = key
+        self.data = data
+        self.seq = seq
+        self.status = "queued"
+        self.text = None
+        self.error = None
+        self.submitted = time.monotonic()
+        self.started = None
+        self.finished = None
+        self.done = threading.Event()
+
+    def finish(self, status, text=None, error=None):
+        self.status = status
+        self.text = text
+        self.error = error
+        self.data = None
+        self.finished = time.monotonic()
+        self.done.set()
+
+
+class IngestQueue:
+
+    def __init__(self, workers=INGEST_WORKERS, max_pending=MAX_PENDING,
+                 timeout=JOB_TIMEOUT, max_pages=MAX_PAGES, max_chars=MAX_CHARS,
+                 time_budget=TIME_BUDGET, max_finished=MAX_FINISHED):
+        self.workers = workers
+        self.timeout = timeout
+        # time_budget None means no parse budget; the job timeout still applies
+        budget = timeout if time_budget is None else min(time_budget, timeout)
+        self.limits = (max_pages, max_chars, budget)
+        self.max_finished = max_finished
+
+        self._pending = queue.Queue(maxsize=max_pending)
+        self._lock = threading.Lock()
+        self._jobs = {}
+        self._by_key = {}
+        self._finished = OrderedDict()
+        self._ids = itertools.count(1)
+        self._submitted = 0
+        self._dequeued = 0
+        self._stats = {"done": 0, "failed": 0, "timeout": 0, "rejected": 0, "cached": 0}
+
+        self._threads = []
+        for _ in range(workers):
+            thread = threading.Thread(target=self._dispatch, daemon=True)
+            thread.start()
+            self._threads.append(thread)
+
+    # ---------- client side ----------
+    def submit(self, uploaded_file):
+        try:
+            data = read_pdf_bytes(uploaded_file)
+        except Exception:
+            return False, "Could not read this PDF."
+
+        key = pdf_cache_key(data, *self.limits[:2])
+
+        with self._lock:
+            # the same upload (e.g. a Streamlit rerun) joins the existing job;
+            # failed and timed-out jobs are not reused, so a resubmit retries
+            existing = self._jobs.get(self._by_key.get(key))
+            if existing is not None and existing.status in ("queued", "running", "done"):
+                return True, existing.id
+
+            job = IngestJob(f"pdf-{next(self._ids)}", key, data, self._submitted)
+
+            cached = get_cached_text(key)
+            if cached is not None:
+                job.finish("done", cached)
+                self._stats["cached"] += 1
+                metrics.count("ingest_jobs", status="cached")
+                self._register(job)
+                self._retire(job)
+                return True, job.id
+
+            try:
+                self._pending.put_nowait(job)
+            except queue.Full:
+                self._stats["rejected"] += 1
+                metrics.count("ingest_jobs", status="rejected")
+                return False, QUEUE_FULL_MESSAGE
+
+            self._submitted += 1
+            self._register(job)
+            return True, job.id
+
+    def poll(self, job_id):
+        with self._lock:
+            job = self._jobs.get(job_id)
+            if job is None:
+                return {"status": "unknown"}
+
+            info = {"status": job.status}
+            if job.status == "queued":
+                info["position"] = job.seq - self._dequeued + 1
+            if job.started is not None:
+                info["elapsed"] = (job.finished or time.monotonic()) - job.started
+            return info
+
+    def result(self, job_id, wait=None):
+        with self._lock:
+            job = self._jobs.get(job_id)
+
+        if job is None:
+            return False, "Unknown ingestion job."
+
+        if not job.done.wait(wait):
+            return False, "Still processing."
+
+        if job.status == "done":
+            return True, job.text
+        if job.status == "timeout":
+            return False, "PDF parsing timed out."
+        return False, "Could not read this PDF."
+
+    def stats(self):
+        with self._lock:
+            running = sum(1 for j in self._jobs.values() if j.status == "running")
+            return dict(
+                self._stats,
+                queued=self._pending.qsize(),
+                running=running,
+                workers=self.workers,
+            )
+
+    def close(self):
+        for _ in self._threads:
+            self._pending.put(None)
+        for thread in self._threads:
+            thread.join(timeout=5)
+
+    # ---------- bookkeeping ----------
+    def _register(self, job):
+        self._jobs[job.id] = job
+        self._by_key[job.key] = job.id
+
+    def _retire(self, job):
+        # keep the most recent finished jobs around for poll() / result()
+        self._finished[job.id] = job
+
+        if job.status != "done" and self._by_key.get(job.key) == job.id:
+            del self._by_key[job.key]
+
+        while len(self._finished) > self.max_finished:
+            _, old = self._finished.popitem(last=False)
+            del self._jobs[old.id]
+            if self._by_key.get(old.key) == old.id:
+                del self._by_key[old.key]
+
+    # ---------- worker side ----------
+    def _dispatch(self):
+        slot = _WorkerSlot()
+
+        while True:
+            job = self._pending.get()
+            if job is None:
+                slot.close()
+                return
+
+            with self._lock:
+                job.status = "running"
+                job.started = time.monotonic()
+                self._dequeued += 1
+
+            metrics.observe("ingest_queue_wait", job.started - job.submitted)
+            start = time.perf_counter()
+
+            try:
+                ok, payload, spans = slot.run((job.data, *self.limits), self.timeout)
+                metrics.merge(spans)
+            except TimeoutError:
+                ok, payload, status = False, "timed out", "timeout"
+            except (EOFError, OSError) as e:
+                # worker died mid-job (e.g. out of memory)
+                slot.restart()
+                ok, payload, status = False, str(e), "failed"
+            else:
+                status = "done" if ok else "failed"
+
+            metrics.observe("ingest_parse_pdf", time.perf_counter() - start, ok)
+            metrics.count("ingest_jobs", status=status)
+
+            if ok:
+                text, cacheable = payload
+                if cacheable:
+                    put_cached_text(job.key, text)
+
+            with self._lock:
+                if ok:
+                    job.finish(status, text)
+                else:
+                    job.finish(status, error=payload)
+                self._stats[status] += 1
+                self._retire(job)
+
+
+_queue = None
+_queue_lock = threading.Lock()
+
+
+def get_ingest_queue():
+    global _queue
+
+    with _queue_lock:
+        if _queue is None:
+            _queue = IngestQueue()
+        return _queue
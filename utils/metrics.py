@@ -0,0 +1,254 @@
+# Per-stage timing, counters and latency histograms, exported in the
+# Prometheus text format.
+#
+# Off unless PLACEMENTIQ_METRICS=1 is set when the process starts. Disabled,
+# @span(...) hands back the undecorated function and `with span(...)`,
+# count() and observe() return immediately, so instrumented code runs at
+# its normal speed.
+#
+#   @span("extract_skills")                 # decorator
+#   def extract_skills(...): ...
+#
+#   with span("parse_pdf"):                 # context manager
+#       ...
+#
+#   count("http_requests", endpoint="/score", status="200")
+#   observe("ingest_queue_wait", seconds)
+#
+# A span records its duration in the <prefix>_stage_seconds histogram and,
+# when it raises (or returns an (ok, value) tuple with ok False, the
+# convention used across this repo), bumps <prefix>_stage_errors_total.
+#
+# Export: prometheus_text() for an HTTP endpoint (serve.py serves it at
+# GET /metrics), write_prometheus(path) for a file, or set
+# PLACEMENTIQ_METRICS_FILE to have it rewritten every
+# PLACEMENTIQ_METRICS_INTERVAL seconds and at exit (e.g. for the node
+# exporter textfile collector). Worker processes can drain() their data and
+# the parent merge() it.
+
+import atexit
+import functools
+import multiprocessing
+import os
+import threading
+import time
+from bisect import bisect_left
+
+ENABLED = os.environ.get("PLACEMENTIQ_METRICS", "").lower() in ("1", "true", "yes", "on")
+METRICS_FILE = os.environ.get("PLACEMENTIQ_METRICS_FILE")
+WRITE_INTERVAL = float(os.environ.get("PLACEMENTIQ_METRICS_INTERVAL", 15))
+
+PREFIX = "placementiq"
+
+# upper bounds in seconds; +Inf is implied
+BUCKETS = (0.0001, 0.00025, 0.0005, 0.001, 0.0025, 0.005, 0.01, 0.025,
+           0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+
+_lock = threading.Lock()
+_histograms = {}   # name -> {"buckets": [...], "sum": s, "count": n, "errors": e}
+_counters = {}     # (name, ((label, value), ...)) -> n
+
+
+def _new_histogram():
+    return {"buckets": [0] * (len(BUCKETS) + 1), "sum": 0.0, "count": 0, "errors": 0}
+
+
+def _record(name, seconds, ok=True):
+    with _lock:
+        h = _histograms.get(name)
+        if h is None:
+            h = _histograms[name] = _new_histogram()
+        h["buckets"][bisect_left(BUCKETS, seconds)] += 1
+        h["sum"] += seconds
+        h["count"] += 1
+        if not ok:
+            h["errors"] += 1
+
+
+def _failed(result):
+    return type(result) is tuple and len(result) > 0 and result[0] is False
+
+
+# ---------- SPANS ----------
+class _Span:
+    __slots__ = ("name", "start")
+
+    def __init__(self, name):
+        self.name = name
+
+    def __enter__(self):
+        self.start = time.perf_counter()
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        _record(self.name, time.perf_counter() - self.start, exc_type is None)
+        return False
+
+    def __call__(self, fn):
+        name = self.name
+
+        @functools.wraps(fn)
+        def wrapper(*args, **kwargs):
+            start = time.perf_counter()
+            try:
+                result = fn(*args, **kwargs)
+            except BaseException:
+                _record(name, time.perf_counter() - start, False)
+                raise
+            _record(name, time.perf_counter() - start, not _failed(result))
+            return result
+
+        return wrapper
+
+
+class _NoSpan:
+    __slots__ = ()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        return False
+
+    def __call__(self, fn):
+        return fn
+
+
+_NO_SPAN = _NoSpan()
+
+
+def span(name):
+    if not ENABLED:
+        return _NO_SPAN
+    return _Span(name)
+
+
+def observe(name, seconds, ok=True):
+    if ENABLED:
+        _record(name, seconds, ok)
+
+
+def count(name, amount=1, **labels):
+    if not ENABLED:
+        return
+
+    key = (name, tuple(sorted(labels.items())))
+    with _lock:
+        _counters[key] = _counters.get(key, 0) + amount
+
+
+# ---------- SNAPSHOTS ----------
+def snapshot(reset=False):
+    global _histograms, _counters
+
+    with _lock:
+        histograms, counters = _histograms, _counters
+        if reset:
+            _histograms, _counters = {}, {}
+        else:
+            histograms = {k: dict(v, buckets=list(v["buckets"])) for k, v in histograms.items()}
+            counters = dict(counters)
+
+    return {"histograms": histograms, "counters": counters}
+
+
+def drain():
+    # hand this process's data to a parent and start over; None if empty
+    if not ENABLED:
+        return None
+    snap = snapshot(reset=True)
+    return snap if snap["histograms"] or snap["counters"] else None
+
+
+def merge(snap):
+    if not snap:
+        return
+
+    with _lock:
+        for name, other in snap["histograms"].items():
+            h = _histograms.get(name)
+            if h is None:
+                h = _histograms[name] = _new_histogram()
+            h["buckets"] = [a + b for a, b in zip(h["buckets"], other["buckets"])]
+            h["sum"] += other["sum"]
+            h["count"] += other["count"]
+            h["errors"] += other["errors"]
+
+        for key, value in snap["counters"].items():
+            _counters[key] = _counters.get(key, 0) + value
+
+
+def reset():
+    snapshot(reset=True)
+
+
+# ---------- PROMETHEUS ----------
+def _escape(value):
+    return str(value).replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+
+def _labels(pairs):
+    if not pairs:
+        return ""
+    return "{" + ",".join(f'{k}="{_escape(v)}"' for k, v in pairs) + "}"
+
+
+def prometheus_text():
+    snap = snapshot()
+    lines = []
+
+    if snap["histograms"]:
+        metric = f"{PREFIX}_stage_seconds"
+        lines += [f"# HELP {metric} Time spent in each pipeline stage.",
+                  f"# TYPE {metric} histogram"]
+
+        for name, h in sorted(snap["histograms"].items()):
+            cumulative = 0
+            for bound, n in zip(BUCKETS + ("+Inf",), h["buckets"]):
+                cumulative += n
+                lines.append(f"{metric}_bucket{_labels([('stage', name), ('le', bound)])} {cumulative}")
+            lines.append(f"{metric}_sum{_labels([('stage', name)])} {h['sum']!r}")
+            lines.append(f"{metric}_count{_labels([('stage', name)])} {h['count']}")
+
+        metric = f"{PREFIX}_stage_errors_total"
+        lines += [f"# HELP {metric} Stage calls that raised or returned ok=False.",
+                  f"# TYPE {metric} counter"]
+        for name, h in sorted(snap["histograms"].items()):
+            lines.append(f"{metric}{_labels([('stage', name)])} {h['errors']}")
+
+    by_name = {}
+    for (name, labels), value in snap["counters"].items():
+        by_name.setdefault(name, []).append((labels, value))
+
+    for name, series in sorted(by_name.items()):
+        metric = f"{PREFIX}_{name}_total"
+        lines.append(f"# TYPE {metric} counter")
+        for labels, value in sorted(series):
+            lines.append(f"{metric}{_labels(labels)} {value}")
+
+    return "\n".join(lines) + "\n" if lines else ""
+
+
+def write_prometheus(path):
+    # atomic, so a scraper never reads a half-written file
+    tmp = f"{path}.tmp"
+    with open(tmp, "w", encoding="utf-8") as f:
+        f.write(prometheus_text())
+    os.replace(tmp, path)
+
+
+def _writer_loop(path, interval):
+    while True:
+        time.sleep(interval)
+        try:
+            write_prometheus(path)
+        except OSError:
+            pass
+
+
+# only the top-level process owns the file; workers report through drain()
+if ENABLED and METRICS_FILE and multiprocessing.parent_process() is None:
+    threading.Thread(
+        target=_writer_loop, args=(METRICS_FILE, WRITE_INTERVAL), daemon=True
+    ).start()
+    atexit.register(write_prometheus, METRICS_FILE)
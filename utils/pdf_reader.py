@@ -1,17 +1,293 @@
+import hashlib
+import io
+import os
+import threading
+import time
+from concurrent.futures import ProcessPoolExecutor, TimeoutError
 
-import pdfplumber
+from utils.cache import DiskTextCache, LRUCache
+from utils.metrics import span
+
+# ---------- EXTRACTED TEXT CACHE ----------
+# Keyed by a hash of the PDF bytes, so re-analyzing the same upload on a
+# Streamlit rerun skips PDF parsing entirely.
+PDF_CACHE_MAX_BYTES = 32 * 1024 * 1024
+
+_memory_cache = LRUCache(PDF_CACHE_MAX_BYTES, sizeof=lambda text: len(text.encode("utf-8")))
+_disk_cache = None
+
+if os.environ.get("PLACEMENTIQ_PDF_CACHE_DIR"):
+    _disk_cache = DiskTextCache(os.environ["PLACEMENTIQ_PDF_CACHE_DIR"])
+
+
+def configure_pdf_cache(max_bytes=None, disk_dir=None):
+    global _disk_cache
+
+    if max_bytes is not None:
+        _memory_cache.max_size = max_bytes
+        _memory_cache.clear()
+
+    if disk_dir is not None:
+        _disk_cache = DiskTextCache(disk_dir) if disk_dir else None
+
+
+def pdf_cache_info():
+    return {
+        "hits": _memory_cache.hits,
+        "misses": _memory_cache.misses,
+        "entries": len(_memory_cache),
+        "bytes": _memory_cache.size,
+        "disk_dir": _disk_cache.directory if _disk_cache else None,
+    }
+
+
+def read_pdf_bytes(uploaded_file):
+    if isinstance(uploaded_file, (bytes, bytearray)):
+        return bytes(uploaded_file)
+
+    if isinstance(uploaded_file, (str, os.PathLike)):
+        with open(uploaded_file, "rb") as f:
+            return f.read()
+
+    if hasattr(uploaded_file, "getvalue"):
+        return uploaded_file.getvalue()
+
+    data = uploaded_file.read()
+    uploaded_file.seek(0)
+    return data
+
+
+def _open_pdf(data):
+    # pdfplumber (and pdfminer under it) is only imported once a PDF is
+    # actually parsed, so importing this module stays cheap
+    import pdfplumber
+    return pdfplumber.open(io.BytesIO(data))
+
+
+def _cache_get(key):
+    text = _memory_cache.get(key)
+
+    if text is None and _disk_cache is not None:
+        text = _disk_cache.get(key)
+        if text is not None:
+            _memory_cache.put(key, text)
+
+    return text
+
+
+def _cache_put(key, text):
+    _memory_cache.put(key, text)
+
+    if _disk_cache is not None:
+        _disk_cache.put(key, text)
+
+
+# ---------- PAGE LIMITS ----------
+# Uploads are untrusted: stop early on huge documents instead of parsing
+# (and holding) hundreds of pages.
+MAX_PAGES = 50
+MAX_CHARS = 200_000
+TIME_BUDGET = 20.0  # seconds per document
+
+
+class PDFLimitExceeded(Exception):
+    def __init__(self, reason, pages_read):
+        super().__init__(f"PDF {reason} limit reached after {pages_read} pages")
+        self.reason = reason
+        self.pages_read = pages_read
+
+
+def _budgeted(texts, n_pages, n_read, max_pages, max_chars, time_budget):
+    # n_pages: pages in the document; n_read: pages that will be read, i.e.
+    # n_pages capped at max_pages. Running out of time on the last page
+    # that would be read anyway is not a time cut.
+    start = time.perf_counter()
+    chars = 0
+    read = 0
+
+    for txt in texts:
+        txt = txt or ""
+
+        if max_chars is not None and chars + len(txt) > max_chars:
+            yield txt[:max_chars - chars]
+            raise PDFLimitExceeded("max_chars", read + 1)
+
+        chars += len(txt)
+        read += 1
+        yield txt
+
+        if (time_budget is not None and read < n_read
+                and time.perf_counter() - start > time_budget):
+            raise PDFLimitExceeded("time_budget", read)
+
+    if max_pages is not None and n_pages > max_pages:
+        raise PDFLimitExceeded("max_pages", read)
+
+
+def iter_pdf_pages(uploaded_file, max_pages=MAX_PAGES, max_chars=MAX_CHARS,
+                   time_budget=TIME_BUDGET):
+    # Yields page text one page at a time, so analysis can start on page 1.
+    # Raises PDFLimitExceeded after the last page that fits the limits.
+    data = read_pdf_bytes(uploaded_file)
+
+    with _open_pdf(data) as pdf:
+        pages = pdf.pages
+        n_read = len(pages) if max_pages is None else min(len(pages), max_pages)
+        texts = (page.extract_text() for page in pages[:n_read])
+        yield from _budgeted(texts, len(pages), n_read, max_pages, max_chars, time_budget)
+
+
+# ---------- PARALLEL PAGE EXTRACTION ----------
+# Documents shorter than this are parsed serially: spreading a handful of
+# pages over processes costs more in IPC and re-opening than it saves.
+PARALLEL_MIN_PAGES = 8
+RANGE_GRACE = 0.5  # seconds past the deadline to wait for a range's finished pages
+
+_pool = None
+_pool_workers = 0
+_pool_lock = threading.Lock()
+
+
+def _get_pool(workers):
+    global _pool, _pool_workers
+
+    with _pool_lock:
+        if _pool is None or _pool_workers != workers:
+            if _pool is not None:
+                _pool.shutdown()
+            _pool = ProcessPoolExecutor(max_workers=workers)
+            _pool_workers = workers
+
+        return _pool
+
+
+def _extract_page_range(data, start, stop, deadline=None):
+    # deadline: time.time() after which no further page is started, so a
+    # document over its time budget stops using the pool's workers too.
+    # A range that stops early returns fewer texts than it has pages.
+    texts = []
+
+    with _open_pdf(data) as pdf:
+        for page in pdf.pages[start:stop]:
+            if deadline is not None and time.time() > deadline:
+                break
+            texts.append(page.extract_text())
+
+    return texts
+
+
+def _page_ranges(n_pages, workers):
+    step = -(-n_pages // workers)
+    return [(start, min(start + step, n_pages)) for start in range(0, n_pages, step)]
+
+
+def _collect(futures, ranges, deadline):
+    read = 0
 
-def extract_text_from_pdf(uploaded_file):
     try:
-        text_pages = []
+        for future, (start, stop) in zip(futures, ranges):
+            # past the deadline a range still returns the pages it finished,
+            # so wait a little longer for that partial result
+            timeout = None if deadline is None else max(deadline - time.time(), 0) + RANGE_GRACE
+            try:
+                texts = future.result(timeout=timeout)
+            except TimeoutError:
+                raise PDFLimitExceeded("time_budget", read)
+
+            for txt in texts:
+                read += 1
+                yield txt
+
+            if len(texts) < stop - start:
+                raise PDFLimitExceeded("time_budget", read)
+    finally:
+        # ranges still queued never start; running ones stop at their
+        # next page once the deadline has passed
+        for future in futures:
+            future.cancel()
+
+
+def _extract_pages(data, workers, max_pages, max_chars, time_budget):
+    with _open_pdf(data) as pdf:
+        n_pages = len(pdf.pages)
+        n_read = n_pages if max_pages is None else min(n_pages, max_pages)
+
+        if workers <= 1 or n_read < PARALLEL_MIN_PAGES:
+            texts = (page.extract_text() for page in pdf.pages[:n_read])
+            yield from _budgeted(texts, n_pages, n_read, max_pages, max_chars, time_budget)
+            return
+
+    # wall-clock, since the deadline is checked in the pool's processes
+    deadline = None if time_budget is None else time.time() + time_budget
+    ranges = _page_ranges(n_read, workers)
+    pool = _get_pool(workers)
+    futures = [
+        pool.submit(_extract_page_range, data, start, stop, deadline)
+        for start, stop in ranges
+    ]
+    texts = _collect(futures, ranges, deadline)
+    yield from _budgeted(texts, n_pages, n_read, max_pages, max_chars, time_budget)
+
+
+def pdf_cache_key(data, max_pages=MAX_PAGES, max_chars=MAX_CHARS):
+    key = hashlib.sha256(data).hexdigest()
+    if max_pages is not None or max_chars is not None:
+        key = f"{key}-{max_pages}-{max_chars}"
+    return key
+
+
+def get_cached_text(key):
+    return _cache_get(key)
+
+
+def put_cached_text(key, text):
+    _cache_put(key, text)
+
+
+@span("parse_pdf_bytes")
+def parse_pdf_bytes(data, workers=1, max_pages=MAX_PAGES, max_chars=MAX_CHARS,
+                    time_budget=TIME_BUDGET):
+    # Uncached parse. Returns (text, cacheable); raises if the PDF can't
+    # be read at all.
+    if workers is None:
+        workers = os.cpu_count() or 1
+
+    text_pages = []
+    cacheable = True
+
+    try:
+        for txt in _extract_pages(data, workers, max_pages, max_chars, time_budget):
+            if txt:
+                text_pages.append(txt)
+    except PDFLimitExceeded as e:
+        # a time cut depends on machine load; don't cache it
+        cacheable = e.reason != "time_budget"
+
+    return "\n".join(text_pages), cacheable
+
+
+@span("extract_text_from_pdf")
+def extract_text_from_pdf(uploaded_file, use_cache=True, workers=1,
+                          max_pages=MAX_PAGES, max_chars=MAX_CHARS,
+                          time_budget=TIME_BUDGET):
+    # workers > 1 splits page ranges across a process pool (None = all cores);
+    # text is always reassembled in page order. Documents over a limit are
+    # cut at that limit rather than rejected.
+    try:
+        data = read_pdf_bytes(uploaded_file)
+        key = pdf_cache_key(data, max_pages, max_chars)
+
+        if use_cache:
+            cached = _cache_get(key)
+            if cached is not None:
+                return True, cached
+
+        text, cacheable = parse_pdf_bytes(data, workers, max_pages, max_chars, time_budget)
 
-        with pdfplumber.open(uploaded_file) as pdf:
-            for page in pdf.pages:
-                txt = page.extract_text()
-                if txt:
-                    text_pages.append(txt)
+        if use_cache and cacheable:
+            _cache_put(key, text)
 
-        return True, "\n".join(text_pages)
+        return True, text
 
     except Exception:
-        return False, ""
\ No newline at end of file
+        return False, ""
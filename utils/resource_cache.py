@@ -0,0 +1,107 @@
+# Process-wide cache for the model artifact and static assets.
+#
+# Streamlit re-executes app.py on every widget change, but imported modules
+# stay in sys.modules, so entries kept here survive reruns. An entry is
+# reloaded only when the file's mtime changes (e.g. after train_model.py).
+
+import os
+import threading
+import time
+
+_lock = threading.Lock()
+_entries = {}
+_stats = {"hits": 0, "misses": 0}
+
+
+def _cached(kind, path, loader):
+    path = os.path.abspath(path)
+    mtime = os.stat(path).st_mtime_ns
+    key = (kind, path)
+
+    with _lock:
+        entry = _entries.get(key)
+
+        if entry is not None and entry["mtime"] == mtime:
+            entry["hits"] += 1
+            _stats["hits"] += 1
+            return entry["value"]
+
+        start = time.perf_counter()
+        value = loader(path)
+        load_time = time.perf_counter() - start
+
+        _entries[key] = {
+            "mtime": mtime,
+            "value": value,
+            "load_time": load_time,
+            "hits": 0,
+        }
+        _stats["misses"] += 1
+        return value
+
+
+def _read_text(path):
+    with open(path, encoding="utf-8") as f:
+        return f.read()
+
+
+def _read_bytes(path):
+    with open(path, "rb") as f:
+        return f.read()
+
+
+def load_model(path):
+    import joblib
+    return _cached("model", path, joblib.load)
+
+
+def load_compact_model(path):
+    from models.compact import load_compact
+    return _cached("compact", path, load_compact)
+
+
+def file_digest(path):
+    from models.compact import file_digest as digest
+    return _cached("digest", path, digest)
+
+
+def read_text(path):
+    return _cached("text", path, _read_text)
+
+
+def read_bytes(path):
+    return _cached("bytes", path, _read_bytes)
+
+
+def file_version(path):
+    # changes whenever the file is rewritten, e.g. a retrained model
+    stat = os.stat(path)
+    return f"{stat.st_mtime_ns}-{stat.st_size}"
+
+
+def invalidate(path=None):
+    with _lock:
+        if path is None:
+            _entries.clear()
+            return
+        path = os.path.abspath(path)
+        for key in [k for k in _entries if k[1] == path]:
+            del _entries[key]
+
+
+def cache_info(path=None, kind=None):
+    # kind ("model", "compact", "digest", ...) picks the entry when one file
+    # is cached several ways; without it the first entry for path is used
+    with _lock:
+        if path is None:
+            return dict(_stats, entries=len(_entries))
+
+        path = os.path.abspath(path)
+        for (k, p), entry in _entries.items():
+            if p == path and kind in (None, k):
+                return {
+                    "kind": k,
+                    "load_time": entry["load_time"],
+                    "hits": entry["hits"],
+                }
+        return None
@@ -1,16 +1,18 @@
 
+from nlp.tokenizer import tokenize
+
+
 def validate_resume_text(resume_text):
-    text = resume_text.strip()
+    doc = tokenize(resume_text)
+    words = doc.words
 
-    if text == "":
+    if not words:
         return False, "Please paste your resume."
 
-    words = text.lower().split()
-
     if len(words) <= 1:
         return False, "Resume text seems invalid."
 
-    if len(set(words)) <= 1:
+    if len(doc.unique_words) <= 1:
         return False, "Resume text looks like repeated spam."
 
     real_words = [w for w in words if any(c.isalpha() for c in w)]
@@ -18,7 +20,7 @@ def validate_resume_text(resume_text):
     if len(real_words) < 3:
         return False, "Resume text seems invalid."
 
-    unique_ratio = len(set(words)) / max(len(words), 1)
+    unique_ratio = len(doc.unique_words) / max(len(words), 1)
     if len(words) > 6 and unique_ratio < 0.3:
         return False, "Resume text looks like repeated spam."
 